@@ -164,7 +164,10 @@ class NovelProcessor:
                 raise Exception("API key required for AI rewriting mode. Please configure it in settings.")
 
         # Create splitter for the chosen mode (AI or mechanical)
-        splitter = SentenceSplitter(word_limit=word_limit, mode=mode, api_key=api_key, use_gemini=use_gemini)
+        # The rewrite cache lives next to the config file rather than in the cwd
+        cache_dir = os.path.dirname(os.path.abspath(self.config.config_path))
+        splitter = SentenceSplitter(word_limit=word_limit, mode=mode, api_key=api_key,
+                                    use_gemini=use_gemini, cache_dir=cache_dir)
         # Expose the live splitter so summaries can report API usage and token cost in the UI
         self._active_splitter = splitter
 
@@ -190,6 +193,11 @@ class NovelProcessor:
 
         return self.results
     
+    def close(self):
+        """Release the active splitter's resources (its persistent rewrite cache)"""
+        if self._active_splitter is not None:
+            self._active_splitter.close()
+    
     def generate_dataframe(self) -> pd.DataFrame:
         """
         Generate pandas DataFrame from results
@@ -439,75 +447,73 @@ class NovelProcessor:
         # Get DataFrame
         df = self.generate_dataframe()
         
-        # Convert DataFrame to list of lists (including header)
-        data = [df.columns.tolist()] + df.values.tolist()
-        
-        # Write data to default sheet (Sheet1)
-        sheets_manager.write_data(spreadsheet_id, 'Sheet1', data)
+        # Write data (with header) to default sheet (Sheet1) while looking up its ID;
+        # write_data converts the DataFrame in a single vectorized pass
+        write_future = sheets_manager.submit(sheets_manager.write_data, spreadsheet_id, 'Sheet1', df)
+        sheet1_id = sheets_manager.get_sheet_id(spreadsheet_id, 'Sheet1')
+        # The write addresses the sheet by name, so it must land before the rename
+        write_future.result()
         
         # Rename Sheet1 to "Sentences"
-        sheet1_id = sheets_manager.get_sheet_id(spreadsheet_id, 'Sheet1')
         if sheet1_id is not None:
-            rename_request = [{
-                'updateSheetProperties': {
-                    'properties': {
-                        'sheetId': sheet1_id,
-                        'title': 'Sentences'
-                    },
-                    'fields': 'title'
+            # Rename + all static formatting go out in a single batchUpdate
+            with sheets_manager.formatting_batch(spreadsheet_id, sheet1_id) as batch:
+                sheets_manager.rename_sheet(spreadsheet_id, sheet1_id, 'Sentences', batch=batch)
+                
+                # Apply header formatting (blue background)
+                sheets_manager.apply_header_formatting(
+                    spreadsheet_id, 
+                    sheet1_id, 
+                    len(df.columns),
+                    {'red': 0.27, 'green': 0.45, 'blue': 0.77},  # Blue #4472C4
+                    batch=batch
+                )
+                
+                # Apply borders
+                sheets_manager.apply_borders(spreadsheet_id, sheet1_id, len(df) + 1, len(df.columns),
+                                             batch=batch)
+                
+                # Freeze header row
+                sheets_manager.freeze_rows(spreadsheet_id, sheet1_id, 1, batch=batch)
+                
+                # Set column widths (in pixels)
+                column_widths_map = {
+                    0: 60,   # Row
+                    1: 500,  # Sentence
                 }
-            }]
-            sheets_manager.format_sheet(spreadsheet_id, sheet1_id, rename_request)
-            
-            # Apply header formatting (blue background)
-            sheets_manager.apply_header_formatting(
-                spreadsheet_id, 
-                sheet1_id, 
-                len(df.columns),
-                {'red': 0.27, 'green': 0.45, 'blue': 0.77}  # Blue #4472C4
-            )
-            
-            # Apply borders
-            sheets_manager.apply_borders(spreadsheet_id, sheet1_id, len(df) + 1, len(df.columns))
-            
-            # Freeze header row
-            sheets_manager.freeze_rows(spreadsheet_id, sheet1_id, 1)
-            
-            # Set column widths (in pixels)
-            column_widths_map = {
-                0: 60,   # Row
-                1: 500,  # Sentence
-            }
-            if 'Original' in df.columns:
-                column_widths_map[2] = 500  # Original
-                column_widths_map[3] = 150  # Method
-                column_widths_map[4] = 100  # Word_Count
-            else:
-                column_widths_map[2] = 100  # Word_Count
-            
-            sheets_manager.set_column_widths(spreadsheet_id, sheet1_id, column_widths_map)
+                if 'Original' in df.columns:
+                    column_widths_map[2] = 500  # Original
+                    column_widths_map[3] = 150  # Method
+                    column_widths_map[4] = 100  # Word_Count
+                else:
+                    column_widths_map[2] = 100  # Word_Count
+                
+                sheets_manager.set_column_widths(spreadsheet_id, sheet1_id, column_widths_map,
+                                                 batch=batch)
 
-            # Make rows compact like image 2: disable wrap and set fixed row height
-            total_rows = len(df) + 1  # include header
-            total_cols = len(df.columns)
-            # Disable wrapping (clip) and center vertically
-            sheets_manager.set_wrap_strategy(
-                spreadsheet_id,
-                sheet1_id,
-                start_row=0,
-                end_row=total_rows,
-                start_col=0,
-                end_col=total_cols,
-                strategy='CLIP'
-            )
-            # Set a tidy fixed height (22px is a typical compact row height)
-            sheets_manager.set_row_heights(
-                spreadsheet_id,
-                sheet1_id,
-                start_row=0,
-                end_row=total_rows,
-                pixel_size=22
-            )
+                # Make rows compact like image 2: disable wrap and set fixed row height
+                total_rows = len(df) + 1  # include header
+                total_cols = len(df.columns)
+                # Disable wrapping (clip) and center vertically
+                sheets_manager.set_wrap_strategy(
+                    spreadsheet_id,
+                    sheet1_id,
+                    start_row=0,
+                    end_row=total_rows,
+                    start_col=0,
+                    end_col=total_cols,
+                    strategy='CLIP',
+                    batch=batch
+                )
+                # Set a tidy fixed height (22px is a typical compact row height)
+                sheets_manager.set_row_heights(
+                    spreadsheet_id,
+                    sheet1_id,
+                    start_row=0,
+                    end_row=total_rows,
+                    pixel_size=22,
+                    batch=batch
+                )
             
             # Color code rows based on method
             if 'Method' in df.columns:
@@ -545,61 +551,83 @@ class NovelProcessor:
                             }
                         })
                 
-                # Apply colors in batches
+                # Apply colors in batches (independent, so sent concurrently)
                 if color_requests:
                     batch_size = 100
-                    for i in range(0, len(color_requests), batch_size):
-                        batch = color_requests[i:i + batch_size]
-                        sheets_manager.format_sheet(spreadsheet_id, sheet1_id, batch)
+                    color_futures = [
+                        sheets_manager.submit(sheets_manager.format_sheet, spreadsheet_id, sheet1_id,
+                                              color_requests[i:i + batch_size])
+                        for i in range(0, len(color_requests), batch_size)
+                    ]
+                    for future in color_futures:
+                        future.result()
+        
+        # Extra sheets are independent of each other and created concurrently
+        pending_sheets = []
         
         # Add Processing Log sheet if enabled
         if self.config.get_generate_log():
             log_df = self.generate_processing_log()
             if not log_df.empty:
-                sheets_manager.create_sheet(spreadsheet_id, 'Processing Log', 
-                                           row_count=len(log_df) + 10,
-                                           column_count=len(log_df.columns))
+                # Create, fill and format the sheet in a single batchUpdate
+                log_sheet_id = sheets_manager.new_sheet_id()
+                batch = sheets_manager.formatting_batch(spreadsheet_id, log_sheet_id)
                 
-                log_data = [log_df.columns.tolist()] + log_df.values.tolist()
-                sheets_manager.write_data(spreadsheet_id, 'Processing Log', log_data)
+                # Apply header formatting (green background)
+                sheets_manager.apply_header_formatting(
+                    spreadsheet_id,
+                    log_sheet_id,
+                    len(log_df.columns),
+                    {'red': 0.44, 'green': 0.68, 'blue': 0.28},  # Green #70AD47
+                    batch=batch
+                )
                 
-                log_sheet_id = sheets_manager.get_sheet_id(spreadsheet_id, 'Processing Log')
-                if log_sheet_id is not None:
-                    # Apply header formatting (green background)
-                    sheets_manager.apply_header_formatting(
-                        spreadsheet_id,
-                        log_sheet_id,
-                        len(log_df.columns),
-                        {'red': 0.44, 'green': 0.68, 'blue': 0.28}  # Green #70AD47
-                    )
-                    
-                    # Apply borders
-                    sheets_manager.apply_borders(spreadsheet_id, log_sheet_id, 
-                                                len(log_df) + 1, len(log_df.columns))
-                    
-                    # Freeze header row
-                    sheets_manager.freeze_rows(spreadsheet_id, log_sheet_id, 1)
-                    
-                    # Set column widths
-                    log_widths = {i: 250 for i in range(len(log_df.columns))}
-                    sheets_manager.set_column_widths(spreadsheet_id, log_sheet_id, log_widths)
-                    # Apply compact row formatting to Processing Log as well
-                    sheets_manager.set_wrap_strategy(
-                        spreadsheet_id,
-                        log_sheet_id,
-                        start_row=0,
-                        end_row=len(log_df) + 1,
-                        start_col=0,
-                        end_col=len(log_df.columns),
-                        strategy='CLIP'
-                    )
-                    sheets_manager.set_row_heights(
-                        spreadsheet_id,
-                        log_sheet_id,
-                        start_row=0,
-                        end_row=len(log_df) + 1,
-                        pixel_size=22
-                    )
+                # Apply borders
+                sheets_manager.apply_borders(spreadsheet_id, log_sheet_id, 
+                                            len(log_df) + 1, len(log_df.columns),
+                                            batch=batch)
+                
+                # Freeze header row
+                sheets_manager.freeze_rows(spreadsheet_id, log_sheet_id, 1, batch=batch)
+                
+                # Set column widths
+                log_widths = {i: 250 for i in range(len(log_df.columns))}
+                sheets_manager.set_column_widths(spreadsheet_id, log_sheet_id, log_widths,
+                                                 batch=batch)
+                # Apply compact row formatting to Processing Log as well
+                sheets_manager.set_wrap_strategy(
+                    spreadsheet_id,
+                    log_sheet_id,
+                    start_row=0,
+                    end_row=len(log_df) + 1,
+                    start_col=0,
+                    end_col=len(log_df.columns),
+                    strategy='CLIP',
+                    batch=batch
+                )
+                sheets_manager.set_row_heights(
+                    spreadsheet_id,
+                    log_sheet_id,
+                    start_row=0,
+                    end_row=len(log_df) + 1,
+                    pixel_size=22,
+                    batch=batch
+                )
+                
+                pending_sheets.append(sheets_manager.submit(
+                    sheets_manager.create_sheet_with_data,
+                    spreadsheet_id,
+                    'Processing Log',
+                    log_df,
+                    formatting_requests=batch.drain(),
+                    sheet_id=log_sheet_id,
+                    row_count=len(log_df) + 10,
+                    column_count=len(log_df.columns),
+                    # Pinned right after the results sheet; Summary is
+                    # appended, so the tab order holds whichever
+                    # request completes first
+                    index=1
+                ))
         
         # Add Summary sheet
         summary = self.get_summary()
@@ -619,66 +647,83 @@ class NovelProcessor:
              if summary['total_input_sentences'] > 0 else 'N/A']
         ]
         
-        sheets_manager.create_sheet(spreadsheet_id, 'Summary', row_count=20, column_count=2)
-        sheets_manager.write_data(spreadsheet_id, 'Summary', summary_data)
-        
-        summary_sheet_id = sheets_manager.get_sheet_id(spreadsheet_id, 'Summary')
-        if summary_sheet_id is not None:
-            # Apply header formatting (orange background)
-            sheets_manager.apply_header_formatting(
-                spreadsheet_id,
-                summary_sheet_id,
-                2,
-                {'red': 0.93, 'green': 0.49, 'blue': 0.19}  # Orange #ED7D31
-            )
-            
-            # Apply borders
-            sheets_manager.apply_borders(spreadsheet_id, summary_sheet_id, len(summary_data), 2)
-            
-            # Freeze header row
-            sheets_manager.freeze_rows(spreadsheet_id, summary_sheet_id, 1)
-            
-            # Set column widths
-            sheets_manager.set_column_widths(spreadsheet_id, summary_sheet_id, {0: 250, 1: 150})
-            # Compact row formatting for Summary
-            sheets_manager.set_wrap_strategy(
-                spreadsheet_id,
-                summary_sheet_id,
-                start_row=0,
-                end_row=len(summary_data),
-                start_col=0,
-                end_col=2,
-                strategy='CLIP'
-            )
-            sheets_manager.set_row_heights(
-                spreadsheet_id,
-                summary_sheet_id,
-                start_row=0,
-                end_row=len(summary_data),
-                pixel_size=22
-            )
-            
-            # Bold metric names
-            bold_requests = [{
-                'repeatCell': {
-                    'range': {
-                        'sheetId': summary_sheet_id,
-                        'startRowIndex': 1,
-                        'endRowIndex': len(summary_data),
-                        'startColumnIndex': 0,
-                        'endColumnIndex': 1
-                    },
-                    'cell': {
-                        'userEnteredFormat': {
-                            'textFormat': {
-                                'bold': True
-                            }
+        # Create, fill and format the Summary sheet in a single batchUpdate
+        summary_sheet_id = sheets_manager.new_sheet_id()
+        batch = sheets_manager.formatting_batch(spreadsheet_id, summary_sheet_id)
+        
+        # Apply header formatting (orange background)
+        sheets_manager.apply_header_formatting(
+            spreadsheet_id,
+            summary_sheet_id,
+            2,
+            {'red': 0.93, 'green': 0.49, 'blue': 0.19},  # Orange #ED7D31
+            batch=batch
+        )
+        
+        # Apply borders
+        sheets_manager.apply_borders(spreadsheet_id, summary_sheet_id, len(summary_data), 2,
+                                     batch=batch)
+        
+        # Freeze header row
+        sheets_manager.freeze_rows(spreadsheet_id, summary_sheet_id, 1, batch=batch)
+        
+        # Set column widths
+        sheets_manager.set_column_widths(spreadsheet_id, summary_sheet_id, {0: 250, 1: 150},
+                                         batch=batch)
+        # Compact row formatting for Summary
+        sheets_manager.set_wrap_strategy(
+            spreadsheet_id,
+            summary_sheet_id,
+            start_row=0,
+            end_row=len(summary_data),
+            start_col=0,
+            end_col=2,
+            strategy='CLIP',
+            batch=batch
+        )
+        sheets_manager.set_row_heights(
+            spreadsheet_id,
+            summary_sheet_id,
+            start_row=0,
+            end_row=len(summary_data),
+            pixel_size=22,
+            batch=batch
+        )
+        
+        # Bold metric names
+        batch.add([{
+            'repeatCell': {
+                'range': {
+                    'sheetId': summary_sheet_id,
+                    'startRowIndex': 1,
+                    'endRowIndex': len(summary_data),
+                    'startColumnIndex': 0,
+                    'endColumnIndex': 1
+                },
+                'cell': {
+                    'userEnteredFormat': {
+                        'textFormat': {
+                            'bold': True
                         }
-                    },
-                    'fields': 'userEnteredFormat.textFormat.bold'
-                }
-            }]
-            sheets_manager.format_sheet(spreadsheet_id, summary_sheet_id, bold_requests)
+                    }
+                },
+                'fields': 'userEnteredFormat.textFormat.bold'
+            }
+        }])
+        
+        pending_sheets.append(sheets_manager.submit(
+            sheets_manager.create_sheet_with_data,
+            spreadsheet_id,
+            'Summary',
+            summary_data,
+            formatting_requests=batch.drain(),
+            sheet_id=summary_sheet_id,
+            row_count=20,
+            column_count=2
+        ))
+        
+        for future in pending_sheets:
+            future.result()
         
         return result
     
@@ -4,7 +4,9 @@ Handles both AI-powered rewriting and legacy mechanical chunking
 Optimized with adaptive batching and caching for improved performance
 """
 
+import os
 import re
+import hashlib
 import logging
 from typing import List, Tuple, Optional
 from enum import Enum
@@ -15,6 +17,31 @@ from src.utils.sentence_cache import SentenceCache
 
 logger = logging.getLogger(__name__)
 
+# AI rewrites are persisted in this file (inside the splitter's cache_dir)
+# so repeated runs start with a warm cache
+SENTENCE_CACHE_DB = 'sentence_cache.db'
+
+
+def _cache_namespace(rewriter, word_limit: int) -> str:
+    """
+    Namespace of persisted rewrites: they are only reused by a rewriter with
+    the same class, model, word limit and system prompt
+    
+    Args:
+        rewriter: AIRewriter or GeminiRewriter instance
+        word_limit: Maximum words per sentence
+        
+    Returns:
+        Namespace string for SentenceCache
+    """
+    model = getattr(rewriter, 'model', None) or getattr(rewriter, 'model_name', '')
+    if hasattr(rewriter, 'get_system_prompt'):
+        prompt = rewriter.get_system_prompt()
+    else:
+        prompt = getattr(rewriter, '_system_prompt', '')
+    prompt_hash = hashlib.sha1(prompt.encode('utf-8')).hexdigest()[:12]
+    return f"{type(rewriter).__name__}:{model}:{word_limit}:{prompt_hash}"
+
 
 class ProcessingMode(Enum):
     """Processing mode enumeration"""
@@ -40,7 +67,8 @@ class SentenceSplitter:
     """Handles sentence splitting with AI rewriting or mechanical chunking"""
     
     def __init__(self, word_limit: int = 8, mode: ProcessingMode = ProcessingMode.AI_REWRITE,
-                 api_key: Optional[str] = None, use_gemini: bool = False):
+                 api_key: Optional[str] = None, use_gemini: bool = False,
+                 cache_dir: Optional[str] = None):
         """
         Initialize sentence splitter
         
@@ -49,6 +77,7 @@ class SentenceSplitter:
             mode: Processing mode (AI or mechanical)
             api_key: API key (OpenAI or Gemini, required for AI mode)
             use_gemini: If True, use Gemini instead of OpenAI (development only)
+            cache_dir: Directory of the persistent rewrite cache (in-memory only if None)
         """
         self.word_limit = word_limit
         self.mode = mode
@@ -81,8 +110,14 @@ class SentenceSplitter:
         # Live results list so callers can observe progress incrementally
         self.results: List[SentenceResult] = []
         
-        # Initialize cache for AI mode to improve performance
-        self.cache = SentenceCache(max_size=500) if mode == ProcessingMode.AI_REWRITE else None
+        # Initialize cache for AI mode to improve performance; TinyLFU keeps
+        # recurring dialogue/idioms cached across the novel's many one-off sentences
+        self.cache = SentenceCache(
+            max_size=500,
+            db_path=os.path.join(cache_dir, SENTENCE_CACHE_DB) if cache_dir else None,
+            namespace=_cache_namespace(self.ai_rewriter, word_limit),
+            policy='tinylfu'
+        ) if mode == ProcessingMode.AI_REWRITE else None
     
     def count_words(self, text: str) -> int:
         """Count words in text"""
@@ -305,7 +340,7 @@ class SentenceSplitter:
                             pass
                 else:
                     # Check cache before adding to AI batch
-                    if self.cache:
+                    if self.cache is not None:
                         cached_result = self.cache.get(sentence)
                         if cached_result:
                             # Cache hit! Use cached rewrite
@@ -397,7 +432,7 @@ class SentenceSplitter:
                                     success=True
                                 )
                                 # Cache successful rewrites for future use
-                                if self.cache:
+                                if self.cache is not None:
                                     self.cache.put(orig_sentence, rewritten)
                             else:
                                 # Validation failed - fall back to mechanical chunking
@@ -513,7 +548,7 @@ class SentenceSplitter:
             stats.update(token_stats)
         
         # Add cache statistics if cache is enabled
-        if self.cache:
+        if self.cache is not None:
             cache_stats = self.cache.get_stats()
             stats['cache_size'] = cache_stats['size']
             stats['cache_hit_rate'] = cache_stats['hit_rate']
@@ -535,5 +570,10 @@ class SentenceSplitter:
         if self.ai_rewriter:
             self.ai_rewriter.reset_token_count()
         
-        if self.cache:
+        if self.cache is not None:
             self.cache.clear()
+    
+    def close(self):
+        """Close the persistent rewrite cache (results and stats stay available)"""
+        if self.cache is not None:
+            self.cache.close()
@@ -4,8 +4,17 @@ Handles loading and saving configuration settings
 """
 
 import configparser
+import io
 import os
-from typing import Optional
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple
+
+# Drop the reusable save buffer once it grows past this many characters
+_SAVE_BUF_MAX = 128 * 1024
+
+# Parsed config contents shared across instances, keyed by absolute path:
+# {path: (mtime_ns, {section: {option: value}})}
+_PARSE_CACHE: Dict[str, Tuple[int, Dict[str, Dict[str, str]]]] = {}
 
 
 class ConfigManager:
@@ -21,6 +30,13 @@ class ConfigManager:
         self.config_path = config_path
         self.config = configparser.ConfigParser()
         
+        # Batched writes (see transaction())
+        self._in_transaction = False
+        self._pending_save = False
+        
+        # Serialization buffer reused across save_config calls
+        self._save_buf = io.StringIO()
+        
         # Create default config if doesn't exist
         if not os.path.exists(config_path):
             self.create_default_config()
@@ -55,13 +71,105 @@ class ConfigManager:
         self.save_config()
     
     def load_config(self):
-        """Load configuration from file"""
+        """
+        Load configuration from file
+        
+        Sections parsed for an unchanged file (same mtime) are reused from
+        the in-process cache instead of running configparser again.
+        """
+        cache_key = os.path.abspath(self.config_path)
+        try:
+            mtime = os.stat(self.config_path).st_mtime_ns
+        except OSError:
+            self.config.read(self.config_path)
+            return
+        
+        cached = _PARSE_CACHE.get(cache_key)
+        if cached is not None and cached[0] == mtime:
+            self.config.read_dict(cached[1])
+            return
+        
         self.config.read(self.config_path)
+        _PARSE_CACHE[cache_key] = (mtime, self._sections())
+    
+    def _sections(self) -> Dict[str, Dict[str, str]]:
+        """Copy of the parsed config as {section: {option: raw value}}"""
+        return {
+            section: dict(self.config.items(section, raw=True))
+            for section in self.config.sections()
+        }
     
     def save_config(self):
-        """Save configuration to file"""
-        with open(self.config_path, 'w') as f:
-            self.config.write(f)
+        """Save configuration to file (deferred while inside a transaction)"""
+        if self._in_transaction:
+            self._pending_save = True
+            return
+        
+        # Serialize in memory, then write a temp file and swap it in atomically
+        # so a crash mid-write never leaves a truncated config.ini behind
+        buf = self._save_buf
+        buf.seek(0)
+        buf.truncate()
+        self.config.write(buf)
+        data = buf.getvalue()
+        if len(data) > _SAVE_BUF_MAX:
+            self._save_buf = io.StringIO()
+        
+        tmp_path = self.config_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(data)
+        os.replace(tmp_path, self.config_path)
+        _PARSE_CACHE.pop(os.path.abspath(self.config_path), None)
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Batch several setter calls into a single config file write
+        
+        The file is written once when the block exits cleanly. If the block
+        raises, the in-memory settings are rolled back and nothing is saved.
+        
+        Usage:
+            with config.transaction():
+                config.set_word_limit(10)
+                config.set_processing_mode('ai_rewrite')
+        """
+        if self._in_transaction:
+            # Nested transaction: the outermost one performs the write
+            yield self
+            return
+        
+        snapshot = self._sections()
+        self._in_transaction = True
+        try:
+            yield self
+        except BaseException:
+            self._in_transaction = False
+            self._pending_save = False
+            self.config = configparser.ConfigParser()
+            self.config.read_dict(snapshot)
+            raise
+        
+        self._in_transaction = False
+        if self._pending_save:
+            self._pending_save = False
+            self.save_config()
+    
+    def _set_option(self, section: str, option: str, value: str):
+        """
+        Set a config value, skipping the save if it is unchanged
+        
+        Args:
+            section: Config section name
+            option: Option name within the section
+            value: New string value
+        """
+        if section not in self.config:
+            self.config[section] = {}
+        elif self.config[section].get(option) == value:
+            return
+        self.config[section][option] = value
+        self.save_config()
     
     def get_api_key(self) -> Optional[str]:
         """Get OpenAI API key"""
@@ -80,17 +188,11 @@ class ConfigManager:
     
     def set_api_key(self, api_key: str):
         """Set OpenAI API key"""
-        if 'OpenAI' not in self.config:
-            self.config['OpenAI'] = {}
-        self.config['OpenAI']['api_key'] = api_key
-        self.save_config()
+        self._set_option('OpenAI', 'api_key', api_key)
     
     def set_openai_model(self, model: str):
         """Set OpenAI model"""
-        if 'OpenAI' not in self.config:
-            self.config['OpenAI'] = {}
-        self.config['OpenAI']['model'] = model
-        self.save_config()
+        self._set_option('OpenAI', 'model', model)
     
     def get_word_limit(self) -> int:
         """Get default word limit"""
@@ -101,10 +203,7 @@ class ConfigManager:
     
     def set_word_limit(self, limit: int):
         """Set default word limit"""
-        if 'Processing' not in self.config:
-            self.config['Processing'] = {}
-        self.config['Processing']['default_word_limit'] = str(limit)
-        self.save_config()
+        self._set_option('Processing', 'default_word_limit', str(limit))
     
     def get_processing_mode(self) -> str:
         """Get processing mode"""
@@ -115,10 +214,7 @@ class ConfigManager:
     
     def set_processing_mode(self, mode: str):
         """Set processing mode"""
-        if 'Processing' not in self.config:
-            self.config['Processing'] = {}
-        self.config['Processing']['processing_mode'] = mode
-        self.save_config()
+        self._set_option('Processing', 'processing_mode', mode)
     
     def get_show_original(self) -> bool:
         """Get show original sentences setting"""
@@ -129,10 +225,7 @@ class ConfigManager:
     
     def set_show_original(self, show: bool):
         """Set show original sentences setting"""
-        if 'Output' not in self.config:
-            self.config['Output'] = {}
-        self.config['Output']['show_original_sentences'] = str(show).lower()
-        self.save_config()
+        self._set_option('Output', 'show_original_sentences', str(show).lower())
     
     def get_generate_log(self) -> bool:
         """Get generate processing log setting"""
@@ -143,10 +236,7 @@ class ConfigManager:
     
     def set_generate_log(self, generate: bool):
         """Set generate processing log setting"""
-        if 'Output' not in self.config:
-            self.config['Output'] = {}
-        self.config['Output']['generate_processing_log'] = str(generate).lower()
-        self.save_config()
+        self._set_option('Output', 'generate_processing_log', str(generate).lower())
     
     def get_credentials_file(self) -> str:
         """Get Google Sheets credentials file path"""
@@ -165,10 +255,7 @@ class ConfigManager:
     
     def set_gemini_api_key(self, api_key: str):
         """Set Gemini API key"""
-        if 'Gemini' not in self.config:
-            self.config['Gemini'] = {}
-        self.config['Gemini']['gemini_api_key'] = api_key
-        self.save_config()
+        self._set_option('Gemini', 'gemini_api_key', api_key)
     
     def get_use_gemini_dev(self) -> bool:
         """Get use Gemini development flag"""
@@ -179,10 +266,7 @@ class ConfigManager:
     
     def set_use_gemini_dev(self, use_gemini: bool):
         """Set use Gemini development flag"""
-        if 'Processing' not in self.config:
-            self.config['Processing'] = {}
-        self.config['Processing']['use_gemini_dev'] = str(use_gemini).lower()
-        self.save_config()
+        self._set_option('Processing', 'use_gemini_dev', str(use_gemini).lower())
     
     def should_use_gemini(self) -> bool:
         """Check if Gemini should be used (has key + flag enabled)"""
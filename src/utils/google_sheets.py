@@ -4,14 +4,29 @@ Handles authentication and spreadsheet creation using Google Sheets API
 """
 
 import os
+import re
+import time
+import functools
+import random
 import pickle
 import logging
-from typing import List, Dict, Any, Optional
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Callable, Optional, Tuple
+import httplib2
 from google.auth.transport.requests import Request
+from google_auth_httplib2 import AuthorizedHttp
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.model import JsonModel
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib json encoder
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -19,10 +34,364 @@ logger = logging.getLogger(__name__)
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets', 
           'https://www.googleapis.com/auth/drive.file']
 
+# Transient API errors worth retrying (rate limit + server-side failures)
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+MAX_RETRY_ATTEMPTS = 5
+RETRY_BASE_DELAY = 0.5  # seconds, doubled after each failed attempt
+
+RETRY_MAX_DELAY = 60  # seconds
+
+# Sheets allows 60 read and 60 write requests per minute per user; calls
+# are paced client-side so bursts wait instead of collecting 429s
+REQUESTS_PER_MINUTE = 60
+
+# Refresh the OAuth access token this long before it actually expires
+TOKEN_REFRESH_WINDOW = timedelta(minutes=5)
+
+# Serializes token.json reads/writes between threads
+_TOKEN_LOCK = threading.Lock()
+
+# Per-thread Sheets services (see _get_thread_service)
+_thread_local = threading.local()
+
+# Upper bound on concurrent API calls dispatched through submit()
+MAX_CONCURRENT_REQUESTS = 8
+
+# Large value writes are split into requests of at most this many rows so
+# no single JSON body grows unbounded and a retry only resends one chunk
+WRITE_CHUNK_ROWS = 5000
+
+_CELL_RE = re.compile(r'^([A-Za-z]+)(\d+)$')
+
+# Invariant formatting fragments shared by every request (never mutated)
+_BORDER_STYLE = {
+    'style': 'SOLID',
+    'width': 1,
+    'color': {'red': 0.82, 'green': 0.82, 'blue': 0.82}
+}
+_BORDER_SIDES = {
+    side: _BORDER_STYLE
+    for side in ('top', 'bottom', 'left', 'right', 'innerHorizontal', 'innerVertical')
+}
+_HEADER_TEXT_FORMAT = {
+    'foregroundColor': {'red': 1.0, 'green': 1.0, 'blue': 1.0},
+    'bold': True,
+    'fontSize': 11
+}
+_HEADER_FIELDS = 'userEnteredFormat(backgroundColor,textFormat,horizontalAlignment,verticalAlignment)'
+
+
+def _to_rows(data: Any) -> List[List[Any]]:
+    """
+    Convert tabular data to the list-of-rows form the values API expects
+    
+    DataFrames are converted in one vectorized pass (header row first, with
+    missing values written as empty cells); NumPy arrays via tolist().
+    Lists are returned unchanged.
+    
+    Args:
+        data: pandas DataFrame, NumPy array or 2D list
+        
+    Returns:
+        2D list of plain Python values
+    """
+    if hasattr(data, 'columns') and hasattr(data, 'to_numpy'):
+        values = data.astype(object).where(data.notna(), '').to_numpy().tolist()
+        values.insert(0, [str(column) for column in data.columns])
+        return values
+    if hasattr(data, 'tolist'):
+        return data.tolist()
+    return data
+
+
+def _offset_cell(cell: str, rows: int) -> str:
+    """
+    Move an A1 cell reference down by a number of rows
+    
+    Args:
+        cell: Cell reference such as 'A1'
+        rows: Number of rows to move down
+        
+    Returns:
+        Shifted cell reference (e.g. 'A5001')
+    """
+    match = _CELL_RE.match(cell)
+    if not match:
+        raise ValueError(f"Unsupported start cell: {cell}")
+    return f"{match.group(1)}{int(match.group(2)) + rows}"
+
+
+def _chunk_writes(writes: List[Tuple[str, str, List[List[Any]]]],
+                  chunk_rows: int) -> List[List[Dict[str, Any]]]:
+    """
+    Split value writes into groups of at most chunk_rows rows each
+    
+    Args:
+        writes: List of (sheet_name, start_cell, data) tuples
+        chunk_rows: Maximum rows per group
+        
+    Returns:
+        List of groups, each a list of {'range', 'values'} dicts
+    """
+    groups: List[List[Dict[str, Any]]] = [[]]
+    group_rows = 0
+    for sheet_name, start_cell, data in writes:
+        offset = 0
+        while True:
+            room = chunk_rows - group_rows
+            if room <= 0 and offset < len(data):
+                groups.append([])
+                group_rows = 0
+                room = chunk_rows
+            piece = data[offset:offset + room]
+            cell = start_cell if offset == 0 else _offset_cell(start_cell, offset)
+            groups[-1].append({'range': f'{sheet_name}!{cell}', 'values': piece})
+            group_rows += len(piece)
+            offset += len(piece)
+            if offset >= len(data):
+                break
+    return groups
+
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket pacing API requests
+    
+    Holds up to capacity tokens, refilled continuously at rate tokens per
+    second. acquire() takes one token, sleeping until it is available;
+    callers are served in arrival order.
+    """
+    
+    def __init__(self, capacity: int, rate: float,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Initialize token bucket
+        
+        Args:
+            capacity: Maximum burst size
+            rate: Tokens added per second
+            clock: Monotonic clock (seconds)
+            sleep: Function waiting the given number of seconds
+        """
+        self.capacity = capacity
+        self.rate = rate
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Take a token, waiting for the bucket to refill if it is empty"""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve the token even when it isn't there yet, so later
+            # callers queue up behind this one
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        
+        if wait > 0:
+            logger.debug(f"Sheets API rate limit reached, waiting {wait:.1f}s")
+            self._sleep(wait)
+
+
+# Shared by every manager and thread since the quota is per user
+_READ_BUCKET = _TokenBucket(REQUESTS_PER_MINUTE, REQUESTS_PER_MINUTE / 60)
+_WRITE_BUCKET = _TokenBucket(REQUESTS_PER_MINUTE, REQUESTS_PER_MINUTE / 60)
+
+
+def _needs_refresh(creds: Credentials) -> bool:
+    """True if the access token is expired or about to expire"""
+    if not creds.valid:
+        return True
+    if creds.expiry is None:
+        return False
+    # google-auth stores expiry as a naive UTC datetime
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return creds.expiry - now < TOKEN_REFRESH_WINDOW
+
+
+def _load_credentials(credentials_path: str, token_path: str) -> Credentials:
+    """
+    Load OAuth credentials from token.json, refreshing only when the token
+    is expired or close to expiry, and re-running the browser flow when
+    nothing usable is available
+    
+    Args:
+        credentials_path: Path to credentials.json file
+        token_path: Path to token.json file (OAuth token)
+        
+    Returns:
+        Valid credentials
+    """
+    with _TOKEN_LOCK:
+        creds = None
+        stored_json = None
+        
+        # The file token.json stores the user's access and refresh tokens
+        if os.path.exists(token_path):
+            try:
+                creds = Credentials.from_authorized_user_file(token_path, SCOPES)
+                stored_json = creds.to_json()
+            except Exception as e:
+                logger.warning(f"Could not load token.json: {e}")
+                logger.info("Deleting token.json and re-authenticating...")
+                os.remove(token_path)
+                creds = None
+        
+        if creds and creds.refresh_token and _needs_refresh(creds):
+            try:
+                creds.refresh(Request())
+            except Exception as e:
+                logger.warning(f"Could not refresh token: {e}")
+                logger.warning("Deleting token.json and re-authenticating...")
+                if os.path.exists(token_path):
+                    os.remove(token_path)
+                creds = None
+                stored_json = None
+        
+        # If there are no (valid) credentials available, let the user log in
+        if not creds or not creds.valid:
+            flow = InstalledAppFlow.from_client_secrets_file(
+                credentials_path, SCOPES)
+            creds = flow.run_local_server(port=0)
+        
+        # Save the credentials for the next run, but only if they changed.
+        # Write to a temp file and rename so other processes never see a
+        # partially written token.json.
+        token_json = creds.to_json()
+        if token_json != stored_json:
+            tmp_path = token_path + '.tmp'
+            with open(tmp_path, 'w') as token:
+                token.write(token_json)
+            os.replace(tmp_path, token_path)
+    
+    return creds
+
+
+@functools.lru_cache(maxsize=None)
+def _get_credentials(credentials_path: str, token_path: str) -> Credentials:
+    """
+    Load credentials once per credential pair and share them process-wide
+    
+    Args:
+        credentials_path: Absolute path to credentials.json
+        token_path: Absolute path to token.json
+        
+    Returns:
+        Valid credentials
+    """
+    return _load_credentials(credentials_path, token_path)
+
+
+def _get_thread_service(creds: Credentials):
+    """
+    Return the authorized Sheets service for the calling thread
+    
+    httplib2.Http is not thread-safe, so each thread gets its own
+    AuthorizedHttp. Within a thread the service (and its keep-alive
+    connection) is reused by every manager sharing the same credentials.
+    
+    Args:
+        creds: Credentials from _get_credentials
+        
+    Returns:
+        Sheets API service resource
+    """
+    services = getattr(_thread_local, 'services', None)
+    if services is None:
+        services = _thread_local.services = {}
+    
+    service = services.get(id(creds))
+    if service is None:
+        authed_http = AuthorizedHttp(creds, http=httplib2.Http())
+        # Build the service from the discovery document bundled with
+        # google-api-python-client instead of fetching it over the network
+        service = build('sheets', 'v4', http=authed_http,
+                        static_discovery=True, cache_discovery=False,
+                        model=_OrjsonModel() if orjson is not None else None)
+        services[id(creds)] = service
+    return service
+
+
+class _OrjsonModel(JsonModel):
+    """
+    JsonModel that encodes request bodies with orjson
+    
+    orjson is several times faster than the stdlib encoder on the large
+    values/batchUpdate bodies and emits no whitespace. Bodies orjson cannot
+    encode fall back to the default serializer.
+    """
+    
+    def serialize(self, body_value):
+        if isinstance(body_value, dict) and 'data' not in body_value and self._data_wrapper:
+            body_value = {'data': body_value}
+        try:
+            return orjson.dumps(body_value, option=orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            return super().serialize(body_value)
+
+
+class FormattingBatch:
+    """
+    Collects formatting subrequests and sends them in a single batchUpdate
+    
+    Created via GoogleSheetsManager.formatting_batch(); pass it as the
+    batch argument of the formatting helpers. Pending requests are flushed
+    when the with-block exits without an exception.
+    """
+    
+    def __init__(self, manager: 'GoogleSheetsManager', spreadsheet_id: str, sheet_id: int):
+        """
+        Initialize formatting batch
+        
+        Args:
+            manager: Manager used to send the batchUpdate
+            spreadsheet_id: The ID of the spreadsheet
+            sheet_id: The ID of the sheet the requests mostly target
+        """
+        self.manager = manager
+        self.spreadsheet_id = spreadsheet_id
+        self.sheet_id = sheet_id
+        self._pending_requests: List[Dict] = []
+    
+    def add(self, requests: List[Dict]):
+        """Queue formatting subrequests"""
+        self._pending_requests.extend(requests)
+    
+    def flush(self):
+        """Send all queued subrequests as one batchUpdate"""
+        if self._pending_requests:
+            self.manager.format_sheet(self.spreadsheet_id, self.sheet_id, self.drain())
+    
+    def drain(self) -> List[Dict]:
+        """Remove and return the queued subrequests without sending them"""
+        requests = self._pending_requests
+        self._pending_requests = []
+        return requests
+    
+    def __len__(self) -> int:
+        return len(self._pending_requests)
+    
+    def __enter__(self) -> 'FormattingBatch':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.flush()
+        return False
+
 
 class GoogleSheetsManager:
     """Manages Google Sheets operations"""
     
+    # Thread pool shared by all managers for overlapping independent calls
+    _executor: Optional[ThreadPoolExecutor] = None
+    _executor_lock = threading.Lock()
+    
     def __init__(self, credentials_path: str = 'credentials.json', token_path: str = 'token.json'):
         """
         Initialize Google Sheets Manager
@@ -34,76 +403,160 @@ class GoogleSheetsManager:
         self.credentials_path = credentials_path
         self.token_path = token_path
         self.creds = None
-        self.service = None
+        # {spreadsheet_id: {sheet title: sheetId}} (see get_sheet_id)
+        self._sheet_ids: Dict[str, Dict[str, int]] = {}
         self._authenticate()
     
     def _authenticate(self):
         """Authenticate with Google Sheets API using OAuth"""
-        # The file token.json stores the user's access and refresh tokens
-        if os.path.exists(self.token_path):
-            try:
-                self.creds = Credentials.from_authorized_user_file(self.token_path, SCOPES)
-            except Exception as e:
-                logger.warning(f"Could not load token.json: {e}")
-                logger.info("Deleting token.json and re-authenticating...")
-                os.remove(self.token_path)
-                self.creds = None
+        # Credentials are shared by every manager using the same credential
+        # files; the service itself is resolved per thread (see service)
+        self.creds = _get_credentials(
+            os.path.abspath(self.credentials_path),
+            os.path.abspath(self.token_path)
+        )
+    
+    @property
+    def service(self):
+        """Sheets API service bound to the calling thread"""
+        return _get_thread_service(self.creds)
+    
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """Create the shared thread pool on first use"""
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=MAX_CONCURRENT_REQUESTS,
+                    thread_name_prefix='sheets-api'
+                )
+            return cls._executor
+    
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Run an API method on the shared thread pool
         
-        # If there are no (valid) credentials available, let the user log in
-        if not self.creds or not self.creds.valid:
-            if self.creds and self.creds.expired and self.creds.refresh_token:
-                try:
-                    self.creds.refresh(Request())
-                except Exception as e:
-                    print(f"Warning: Could not refresh token: {e}")
-                    print("Deleting token.json and re-authenticating...")
-                    if os.path.exists(self.token_path):
-                        os.remove(self.token_path)
-                    self.creds = None
+        Use for independent calls whose latency can overlap, e.g.
+        submit(manager.write_data, spreadsheet_id, 'Sheet1', data).
+        
+        Args:
+            fn: Manager method (or any callable) to run
+            *args, **kwargs: Arguments passed through to fn
             
-            if not self.creds:
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    self.credentials_path, SCOPES)
-                self.creds = flow.run_local_server(port=0)
+        Returns:
+            Future resolving to fn's return value
+        """
+        return self._get_executor().submit(fn, *args, **kwargs)
+    
+    def _retry(self, fn, read: bool = False):
+        """
+        Call fn(), retrying transient HttpErrors with exponential backoff
+        
+        Every attempt first takes a token from the shared read or write
+        bucket. Honors the Retry-After header when the API provides one;
+        otherwise the delay doubles per attempt (with jitter, capped at
+        RETRY_MAX_DELAY).
+        
+        Args:
+            fn: Zero-argument callable performing the API request
+            read: True for read requests (paced by the read quota)
             
-            # Save the credentials for the next run
-            with open(self.token_path, 'w') as token:
-                token.write(self.creds.to_json())
+        Returns:
+            Whatever fn returns
+        """
+        bucket = _READ_BUCKET if read else _WRITE_BUCKET
         
-        # Build the service
-        self.service = build('sheets', 'v4', credentials=self.creds)
+        for attempt in range(MAX_RETRY_ATTEMPTS):
+            bucket.acquire()
+            try:
+                return fn()
+            except HttpError as error:
+                status = getattr(error.resp, 'status', None)
+                if status not in RETRYABLE_STATUS_CODES or attempt == MAX_RETRY_ATTEMPTS - 1:
+                    raise
+                
+                try:
+                    delay = float(error.resp.get('retry-after'))
+                except (TypeError, ValueError):
+                    delay = RETRY_BASE_DELAY * (2 ** attempt) + random.uniform(0, RETRY_BASE_DELAY)
+                delay = min(delay, RETRY_MAX_DELAY)
+                
+                logger.warning(f"Sheets API returned {status}, retrying in {delay:.1f}s "
+                               f"(attempt {attempt + 1}/{MAX_RETRY_ATTEMPTS})")
+                time.sleep(delay)
     
-    def create_spreadsheet(self, title: str) -> Dict[str, Any]:
+    def create_spreadsheet(self, title: str, initial_rows: Any = None,
+                           frozen_row_count: int = 0,
+                           sheet_name: str = 'Sheet1') -> Dict[str, Any]:
         """
         Create a new Google Spreadsheet
         
+        initial_rows and frozen_row_count are sent inline with the create
+        request, so a small spreadsheet can be filled without a separate
+        values write.
+        
         Args:
             title: Title for the spreadsheet
+            initial_rows: Optional 2D list, NumPy array or DataFrame written
+                to the first sheet starting at A1
+            frozen_row_count: Number of rows to freeze on the first sheet
+            sheet_name: Title of the first sheet
             
         Returns:
             Dictionary containing spreadsheet ID and URL
         """
         try:
+            sheet = {
+                'properties': {
+                    'title': sheet_name
+                }
+            }
+            
+            if frozen_row_count:
+                sheet['properties']['gridProperties'] = {
+                    'frozenRowCount': frozen_row_count
+                }
+            
+            rows = _to_rows(initial_rows) if initial_rows is not None else None
+            if rows:
+                sheet['data'] = [{
+                    'startRow': 0,
+                    'startColumn': 0,
+                    'rowData': [
+                        {'values': [self._to_cell_data(value) for value in row]}
+                        for row in rows
+                    ]
+                }]
+            
             spreadsheet = {
                 'properties': {
                     'title': title
-                }
+                },
+                'sheets': [sheet]
             }
             
-            spreadsheet = self.service.spreadsheets().create(
+            spreadsheet = self._retry(lambda: self.service.spreadsheets().create(
                 body=spreadsheet,
-                fields='spreadsheetId,spreadsheetUrl'
-            ).execute()
+                fields='spreadsheetId,spreadsheetUrl,sheets.properties(sheetId,title)'
+            ).execute())
+            
+            # The reply already lists the sheet IDs, so get_sheet_id needs no
+            # extra metadata fetch for a freshly created spreadsheet
+            spreadsheet_id = spreadsheet.get('spreadsheetId')
+            self._sheet_ids[spreadsheet_id] = {
+                sheet['properties']['title']: sheet['properties']['sheetId']
+                for sheet in spreadsheet.get('sheets', [])
+            }
             
             return {
-                'spreadsheet_id': spreadsheet.get('spreadsheetId'),
+                'spreadsheet_id': spreadsheet_id,
                 'spreadsheet_url': spreadsheet.get('spreadsheetUrl')
             }
         except HttpError as error:
             logger.error(f"An error occurred: {error}")
             raise
     
-    def write_data(self, spreadsheet_id: str, sheet_name: str, data: List[List[Any]], 
+    def write_data(self, spreadsheet_id: str, sheet_name: str, data: Any, 
                    start_cell: str = 'A1'):
         """
         Write data to a specific sheet
@@ -111,27 +564,42 @@ class GoogleSheetsManager:
         Args:
             spreadsheet_id: The ID of the spreadsheet
             sheet_name: Name of the sheet to write to
-            data: 2D list of data to write
+            data: 2D list, NumPy array or DataFrame (written with its header)
             start_cell: Starting cell (e.g., 'A1')
         """
+        self.write_data_batch(spreadsheet_id, [(sheet_name, start_cell, data)])
+    
+    def write_data_batch(self, spreadsheet_id: str,
+                         writes: List[Tuple[str, str, Any]]):
+        """
+        Write several ranges in a single values.batchUpdate call
+        
+        Payloads larger than WRITE_CHUNK_ROWS rows are sent as several
+        sequential calls, each retried on its own.
+        
+        Args:
+            spreadsheet_id: The ID of the spreadsheet
+            writes: List of (sheet_name, start_cell, data) tuples
+        """
+        if not writes:
+            return
+        
+        writes = [(sheet_name, start_cell, _to_rows(data))
+                  for sheet_name, start_cell, data in writes]
+        
         try:
-            range_name = f'{sheet_name}!{start_cell}'
-            body = {
-                'values': data
-            }
-            
-            self.service.spreadsheets().values().update(
-                spreadsheetId=spreadsheet_id,
-                range=range_name,
-                valueInputOption='RAW',
-                body=body
-            ).execute()
+            for data in _chunk_writes(writes, WRITE_CHUNK_ROWS):
+                body = {'valueInputOption': 'RAW', 'data': data}
+                self._retry(lambda: self.service.spreadsheets().values().batchUpdate(
+                    spreadsheetId=spreadsheet_id,
+                    body=body
+                ).execute())
         except HttpError as error:
             logger.error(f"An error occurred: {error}")
             raise
     
     def create_sheet(self, spreadsheet_id: str, sheet_name: str, 
-                     row_count: int = 1000, column_count: int = 26):
+                     row_count: int = 1000, column_count: int = 26) -> int:
         """
         Add a new sheet to an existing spreadsheet
         
@@ -140,6 +608,9 @@ class GoogleSheetsManager:
             sheet_name: Name for the new sheet
             row_count: Number of rows
             column_count: Number of columns
+            
+        Returns:
+            The ID of the new sheet
         """
         try:
             requests = [{
@@ -158,14 +629,101 @@ class GoogleSheetsManager:
                 'requests': requests
             }
             
-            self.service.spreadsheets().batchUpdate(
+            response = self._retry(lambda: self.service.spreadsheets().batchUpdate(
                 spreadsheetId=spreadsheet_id,
                 body=body
-            ).execute()
+            ).execute())
+            
+            # The addSheet reply carries the new sheetId; remember it so
+            # get_sheet_id doesn't have to re-fetch the spreadsheet
+            sheet_id = response['replies'][0]['addSheet']['properties']['sheetId']
+            self._sheet_ids.setdefault(spreadsheet_id, {})[sheet_name] = sheet_id
+            return sheet_id
         except HttpError as error:
             logger.error(f"An error occurred: {error}")
             raise
     
+    @staticmethod
+    def new_sheet_id() -> int:
+        """Pick a client-side sheet ID so follow-up requests can reference it"""
+        return random.randint(1, 2**31 - 1)
+    
+    @staticmethod
+    def _to_cell_data(value: Any) -> Dict[str, Any]:
+        """Convert a Python value to a CellData dict (mirrors RAW input)"""
+        if value is None:
+            return {}
+        if isinstance(value, bool):
+            return {'userEnteredValue': {'boolValue': value}}
+        if isinstance(value, (int, float)):
+            return {'userEnteredValue': {'numberValue': value}}
+        return {'userEnteredValue': {'stringValue': str(value)}}
+    
+    def create_sheet_with_data(self, spreadsheet_id: str, sheet_name: str,
+                               data: Any,
+                               formatting_requests: Optional[List[Dict]] = None,
+                               sheet_id: Optional[int] = None,
+                               row_count: int = 1000, column_count: int = 26,
+                               index: Optional[int] = None) -> int:
+        """
+        Add a sheet, fill it and format it in a single batchUpdate
+        
+        The sheet ID is chosen client-side so the data and formatting
+        requests can target the new sheet within the same call.
+        
+        Args:
+            spreadsheet_id: The ID of the spreadsheet
+            sheet_name: Name for the new sheet
+            data: 2D list, NumPy array or DataFrame to write starting at A1
+            formatting_requests: Formatting requests referencing sheet_id
+            sheet_id: Preassigned sheet ID (generated if omitted)
+            row_count: Number of rows
+            column_count: Number of columns
+            index: Tab position of the new sheet (appended at the end if omitted)
+            
+        Returns:
+            The ID of the new sheet
+        """
+        if sheet_id is None:
+            sheet_id = self.new_sheet_id()
+        data = _to_rows(data)
+        
+        properties = {
+            'sheetId': sheet_id,
+            'title': sheet_name,
+            'gridProperties': {
+                'rowCount': row_count,
+                'columnCount': column_count
+            }
+        }
+        if index is not None:
+            properties['index'] = index
+        
+        requests = [{'addSheet': {'properties': properties}}]
+        
+        if data:
+            requests.append({
+                'updateCells': {
+                    'start': {
+                        'sheetId': sheet_id,
+                        'rowIndex': 0,
+                        'columnIndex': 0
+                    },
+                    'rows': [
+                        {'values': [self._to_cell_data(value) for value in row]}
+                        for row in data
+                    ],
+                    'fields': 'userEnteredValue'
+                }
+            })
+        
+        if formatting_requests:
+            requests.extend(formatting_requests)
+        
+        self.format_sheet(spreadsheet_id, sheet_id, requests)
+        self._sheet_ids.setdefault(spreadsheet_id, {})[sheet_name] = sheet_id
+        return sheet_id
+    
     def format_sheet(self, spreadsheet_id: str, sheet_id: int, formatting_requests: List[Dict]):
         """
         Apply formatting to a sheet
@@ -180,14 +738,40 @@ class GoogleSheetsManager:
                 'requests': formatting_requests
             }
             
-            self.service.spreadsheets().batchUpdate(
+            self._retry(lambda: self.service.spreadsheets().batchUpdate(
                 spreadsheetId=spreadsheet_id,
                 body=body
-            ).execute()
+            ).execute())
         except HttpError as error:
             logger.error(f"An error occurred: {error}")
             raise
     
+    def formatting_batch(self, spreadsheet_id: str, sheet_id: int) -> FormattingBatch:
+        """
+        Start a batch that merges formatting calls into one API request
+        
+        Usage:
+            with manager.formatting_batch(spreadsheet_id, sheet_id) as batch:
+                manager.freeze_rows(spreadsheet_id, sheet_id, 1, batch=batch)
+                manager.apply_borders(spreadsheet_id, sheet_id, 10, 5, batch=batch)
+        
+        Args:
+            spreadsheet_id: The ID of the spreadsheet
+            sheet_id: The ID of the sheet
+            
+        Returns:
+            FormattingBatch context manager
+        """
+        return FormattingBatch(self, spreadsheet_id, sheet_id)
+    
+    def _submit(self, spreadsheet_id: str, sheet_id: int, requests: List[Dict],
+                batch: Optional[FormattingBatch] = None):
+        """Queue requests on batch if given, otherwise send them right away"""
+        if batch is not None:
+            batch.add(requests)
+        else:
+            self.format_sheet(spreadsheet_id, sheet_id, requests)
+    
     def get_sheet_id(self, spreadsheet_id: str, sheet_name: str) -> Optional[int]:
         """
         Get the sheet ID for a given sheet name
@@ -199,22 +783,58 @@ class GoogleSheetsManager:
         Returns:
             Sheet ID or None if not found
         """
-        try:
-            spreadsheet = self.service.spreadsheets().get(
-                spreadsheetId=spreadsheet_id
-            ).execute()
-            
-            for sheet in spreadsheet.get('sheets', []):
-                if sheet['properties']['title'] == sheet_name:
-                    return sheet['properties']['sheetId']
+        sheet_ids = self._sheet_ids.get(spreadsheet_id)
+        if sheet_ids is None or sheet_name not in sheet_ids:
+            try:
+                # Only fetch sheet titles/IDs, not the full spreadsheet metadata
+                spreadsheet = self._retry(lambda: self.service.spreadsheets().get(
+                    spreadsheetId=spreadsheet_id,
+                    fields='sheets.properties(sheetId,title)'
+                ).execute(), read=True)
+            except HttpError as error:
+                logger.error(f"An error occurred: {error}")
+                raise
             
-            return None
-        except HttpError as error:
-            logger.error(f"An error occurred: {error}")
-            raise
+            sheet_ids = {
+                sheet['properties']['title']: sheet['properties']['sheetId']
+                for sheet in spreadsheet.get('sheets', [])
+            }
+            self._sheet_ids[spreadsheet_id] = sheet_ids
+        
+        return sheet_ids.get(sheet_name)
+    
+    def rename_sheet(self, spreadsheet_id: str, sheet_id: int, title: str,
+                     batch: Optional[FormattingBatch] = None):
+        """
+        Rename a sheet
+        
+        Args:
+            spreadsheet_id: The ID of the spreadsheet
+            sheet_id: The ID of the sheet
+            title: New sheet title
+            batch: Optional FormattingBatch to queue the request on
+        """
+        requests = [{
+            'updateSheetProperties': {
+                'properties': {
+                    'sheetId': sheet_id,
+                    'title': title
+                },
+                'fields': 'title'
+            }
+        }]
+        self._submit(spreadsheet_id, sheet_id, requests, batch)
+        
+        sheet_ids = self._sheet_ids.get(spreadsheet_id)
+        if sheet_ids is not None:
+            for name, known_id in list(sheet_ids.items()):
+                if known_id == sheet_id:
+                    del sheet_ids[name]
+            sheet_ids[title] = sheet_id
     
     def set_column_widths(self, spreadsheet_id: str, sheet_id: int, 
-                          column_widths: Dict[int, int]):
+                          column_widths: Dict[int, int],
+                          batch: Optional[FormattingBatch] = None):
         """
         Set column widths
         
@@ -222,6 +842,7 @@ class GoogleSheetsManager:
             spreadsheet_id: The ID of the spreadsheet
             sheet_id: The ID of the sheet
             column_widths: Dictionary mapping column index (0-based) to width in pixels
+            batch: Optional FormattingBatch to queue the requests on
         """
         requests = []
         for col_index, width in column_widths.items():
@@ -241,10 +862,11 @@ class GoogleSheetsManager:
             })
         
         if requests:
-            self.format_sheet(spreadsheet_id, sheet_id, requests)
+            self._submit(spreadsheet_id, sheet_id, requests, batch)
 
     def set_row_heights(self, spreadsheet_id: str, sheet_id: int,
-                         start_row: int, end_row: int, pixel_size: int):
+                         start_row: int, end_row: int, pixel_size: int,
+                         batch: Optional[FormattingBatch] = None):
         """
         Set a fixed row height for a range of rows.
 
@@ -254,6 +876,7 @@ class GoogleSheetsManager:
             start_row: Zero-based start row index (inclusive)
             end_row: Zero-based end row index (exclusive)
             pixel_size: Row height in pixels
+            batch: Optional FormattingBatch to queue the requests on
         """
         request = [{
             'updateDimensionProperties': {
@@ -269,16 +892,18 @@ class GoogleSheetsManager:
                 'fields': 'pixelSize'
             }
         }]
-        self.format_sheet(spreadsheet_id, sheet_id, request)
+        self._submit(spreadsheet_id, sheet_id, request, batch)
 
     def set_wrap_strategy(self, spreadsheet_id: str, sheet_id: int,
                            start_row: int, end_row: int,
                            start_col: int, end_col: int,
-                           strategy: str = 'CLIP'):
+                           strategy: str = 'CLIP',
+                           batch: Optional[FormattingBatch] = None):
         """
         Set text wrap strategy for a rectangular range.
 
         strategy values: 'OVERFLOW_CELL', 'CLIP', or 'WRAP'.
+        Pass batch to queue the request on a FormattingBatch instead.
         """
         request = [{
             'repeatCell': {
@@ -298,9 +923,10 @@ class GoogleSheetsManager:
                 'fields': 'userEnteredFormat.wrapStrategy,userEnteredFormat.verticalAlignment'
             }
         }]
-        self.format_sheet(spreadsheet_id, sheet_id, request)
+        self._submit(spreadsheet_id, sheet_id, request, batch)
     
-    def freeze_rows(self, spreadsheet_id: str, sheet_id: int, num_rows: int = 1):
+    def freeze_rows(self, spreadsheet_id: str, sheet_id: int, num_rows: int = 1,
+                    batch: Optional[FormattingBatch] = None):
         """
         Freeze header rows
         
@@ -308,6 +934,7 @@ class GoogleSheetsManager:
             spreadsheet_id: The ID of the spreadsheet
             sheet_id: The ID of the sheet
             num_rows: Number of rows to freeze
+            batch: Optional FormattingBatch to queue the requests on
         """
         requests = [{
             'updateSheetProperties': {
@@ -321,10 +948,11 @@ class GoogleSheetsManager:
             }
         }]
         
-        self.format_sheet(spreadsheet_id, sheet_id, requests)
+        self._submit(spreadsheet_id, sheet_id, requests, batch)
     
     def apply_header_formatting(self, spreadsheet_id: str, sheet_id: int, 
-                                num_columns: int, bg_color: Dict[str, float]):
+                                num_columns: int, bg_color: Dict[str, float],
+                                batch: Optional[FormattingBatch] = None):
         """
         Apply formatting to header row
         
@@ -333,6 +961,7 @@ class GoogleSheetsManager:
             sheet_id: The ID of the sheet
             num_columns: Number of columns in header
             bg_color: Background color as RGB dict (e.g., {'red': 0.27, 'green': 0.45, 'blue': 0.77})
+            batch: Optional FormattingBatch to queue the requests on
         """
         requests = [
             {
@@ -347,25 +976,22 @@ class GoogleSheetsManager:
                     'cell': {
                         'userEnteredFormat': {
                             'backgroundColor': bg_color,
-                            'textFormat': {
-                                'foregroundColor': {'red': 1.0, 'green': 1.0, 'blue': 1.0},
-                                'bold': True,
-                                'fontSize': 11
-                            },
+                            'textFormat': _HEADER_TEXT_FORMAT,
                             'horizontalAlignment': 'CENTER',
                             'verticalAlignment': 'MIDDLE'
                         }
                     },
-                    'fields': 'userEnteredFormat(backgroundColor,textFormat,horizontalAlignment,verticalAlignment)'
+                    'fields': _HEADER_FIELDS
                 }
             }
         ]
         
-        self.format_sheet(spreadsheet_id, sheet_id, requests)
+        self._submit(spreadsheet_id, sheet_id, requests, batch)
     
     def apply_alternating_row_colors(self, spreadsheet_id: str, sheet_id: int,
                                      num_rows: int, num_columns: int,
-                                     color1: Dict[str, float], color2: Dict[str, float]):
+                                     color1: Dict[str, float], color2: Dict[str, float],
+                                     batch: Optional[FormattingBatch] = None):
         """
         Apply alternating row colors
         
@@ -376,34 +1002,37 @@ class GoogleSheetsManager:
             num_columns: Number of columns
             color1: First color (RGB dict)
             color2: Second color (RGB dict)
+            batch: Optional FormattingBatch to queue the requests on
         """
-        requests = []
+        # Row 0 is the header, so data rows start at index 1
+        if num_rows <= 1:
+            return
         
-        for row in range(1, num_rows):  # Start from 1 to skip header
-            color = color1 if row % 2 == 1 else color2
-            requests.append({
-                'repeatCell': {
+        # A single banded range lets Sheets stripe the rows natively instead
+        # of sending one repeatCell request per row (O(1) payload vs O(rows))
+        requests = [{
+            'addBanding': {
+                'bandedRange': {
                     'range': {
                         'sheetId': sheet_id,
-                        'startRowIndex': row,
-                        'endRowIndex': row + 1,
+                        'startRowIndex': 1,
+                        'endRowIndex': num_rows,
                         'startColumnIndex': 0,
                         'endColumnIndex': num_columns
                     },
-                    'cell': {
-                        'userEnteredFormat': {
-                            'backgroundColor': color
-                        }
-                    },
-                    'fields': 'userEnteredFormat.backgroundColor'
+                    'rowProperties': {
+                        'firstBandColor': color1,
+                        'secondBandColor': color2
+                    }
                 }
-            })
+            }
+        }]
         
-        if requests:
-            self.format_sheet(spreadsheet_id, sheet_id, requests)
+        self._submit(spreadsheet_id, sheet_id, requests, batch)
     
     def apply_borders(self, spreadsheet_id: str, sheet_id: int, 
-                     num_rows: int, num_columns: int):
+                     num_rows: int, num_columns: int,
+                     batch: Optional[FormattingBatch] = None):
         """
         Apply borders to all cells
         
@@ -412,13 +1041,8 @@ class GoogleSheetsManager:
             sheet_id: The ID of the sheet
             num_rows: Total number of rows
             num_columns: Number of columns
+            batch: Optional FormattingBatch to queue the requests on
         """
-        border_style = {
-            'style': 'SOLID',
-            'width': 1,
-            'color': {'red': 0.82, 'green': 0.82, 'blue': 0.82}
-        }
-        
         requests = [{
             'updateBorders': {
                 'range': {
@@ -428,13 +1052,8 @@ class GoogleSheetsManager:
                     'startColumnIndex': 0,
                     'endColumnIndex': num_columns
                 },
-                'top': border_style,
-                'bottom': border_style,
-                'left': border_style,
-                'right': border_style,
-                'innerHorizontal': border_style,
-                'innerVertical': border_style
+                **_BORDER_SIDES
             }
         }]
         
-        self.format_sheet(spreadsheet_id, sheet_id, requests)
+        self._submit(spreadsheet_id, sheet_id, requests, batch)
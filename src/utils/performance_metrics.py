@@ -5,19 +5,67 @@ Tracks and reports processing performance and optimization effectiveness
 
 import time
 import logging
-from typing import Dict, Any, Optional
+import threading
+from typing import Callable, Dict, Any, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+class AtomicCounter:
+    """
+    Counter that is safe to bump and read from several threads
+    
+    All access goes through one lock, so concurrent increments are never
+    lost and reads have no side effects.
+    """
+    
+    def __init__(self, value: int = 0):
+        """
+        Initialize counter
+        
+        Args:
+            value: Starting value
+        """
+        self._value = value
+        self._lock = threading.Lock()
+    
+    def increment(self):
+        """Add one"""
+        with self._lock:
+            self._value += 1
+    
+    def add(self, amount: int):
+        """Add an arbitrary amount"""
+        with self._lock:
+            self._value += amount
+    
+    @property
+    def value(self) -> int:
+        """Current count"""
+        with self._lock:
+            return self._value
+
+
 class PerformanceMetrics:
     """Track detailed performance metrics for optimization analysis"""
     
-    def __init__(self):
-        """Initialize performance tracking"""
+    def __init__(self, clock: Callable[[], float] = time.perf_counter,
+                 cpu_clock: Callable[[], float] = time.process_time):
+        """
+        Initialize performance tracking
+        
+        Args:
+            clock: Monotonic wall clock used by the timers (seconds)
+            cpu_clock: Process CPU clock used by the timers (seconds)
+        """
+        self._clock = clock
+        self._cpu_clock = cpu_clock
+        
         # Timing metrics
         self.start_time: Optional[float] = None
         self.end_time: Optional[float] = None
+        self.cpu_start_time: Optional[float] = None
+        self.cpu_time: float = 0.0
         self.extraction_time: float = 0.0
         self.processing_time: float = 0.0
         self.validation_time: float = 0.0
@@ -29,49 +77,91 @@ class PerformanceMetrics:
         self.mechanical_fallbacks: int = 0
         self.validation_failures: int = 0
         
-        # Efficiency metrics
-        self.api_calls: int = 0
-        self.cache_hits: int = 0
-        self.tokens_used: int = 0
+        # Efficiency metrics (thread-safe, see record_* methods)
+        self._api_calls = AtomicCounter()
+        self._cache_hits = AtomicCounter()
+        self._tokens_used = AtomicCounter()
         
-        # Batch statistics
-        self.batch_sizes: list = []
-        self.batch_times: list = []
+        # Batch statistics (running totals, O(1) memory)
+        self.batch_count: int = 0
+        self._batch_size_sum: int = 0
+        self._batch_time_sum: float = 0.0
         
         # Cost metrics
         self.estimated_cost: float = 0.0
         self.actual_cost: float = 0.0
+        
+        # Last get_summary() result, keyed by the counters it was built from
+        self._summary_cache: Optional[Tuple[tuple, Dict[str, Any]]] = None
+    
+    @property
+    def api_calls(self) -> int:
+        return self._api_calls.value
+    
+    @api_calls.setter
+    def api_calls(self, value: int):
+        self._api_calls = AtomicCounter(value)
+    
+    @property
+    def cache_hits(self) -> int:
+        return self._cache_hits.value
+    
+    @cache_hits.setter
+    def cache_hits(self, value: int):
+        self._cache_hits = AtomicCounter(value)
+    
+    @property
+    def tokens_used(self) -> int:
+        return self._tokens_used.value
+    
+    @tokens_used.setter
+    def tokens_used(self, value: int):
+        self._tokens_used = AtomicCounter(value)
+    
+    def record_api_call(self, tokens: int = 0):
+        """Count one API call and the tokens it used (thread-safe)"""
+        self._api_calls.increment()
+        if tokens:
+            self._tokens_used.add(tokens)
+    
+    def record_cache_hit(self):
+        """Count one cache hit (thread-safe)"""
+        self._cache_hits.increment()
     
     def start_timer(self):
-        """Start overall timing"""
-        self.start_time = time.time()
+        """Start overall timing (wall clock and CPU)"""
+        self.start_time = self._clock()
+        self.cpu_start_time = self._cpu_clock()
     
     def end_timer(self):
-        """End overall timing"""
-        self.end_time = time.time()
+        """End overall timing (wall clock and CPU)"""
+        self.end_time = self._clock()
+        if self.cpu_start_time is not None:
+            self.cpu_time = self._cpu_clock() - self.cpu_start_time
     
     def get_total_time(self) -> float:
         """Get total processing time in seconds"""
-        if self.start_time and self.end_time:
+        if self.start_time is not None and self.end_time is not None:
             return self.end_time - self.start_time
         return 0.0
     
     def record_batch(self, batch_size: int, batch_time: float):
         """Record batch processing statistics"""
-        self.batch_sizes.append(batch_size)
-        self.batch_times.append(batch_time)
+        self.batch_count += 1
+        self._batch_size_sum += batch_size
+        self._batch_time_sum += batch_time
     
     def get_avg_batch_size(self) -> float:
         """Get average batch size"""
-        if not self.batch_sizes:
+        if not self.batch_count:
             return 0.0
-        return sum(self.batch_sizes) / len(self.batch_sizes)
+        return self._batch_size_sum / self.batch_count
     
     def get_avg_batch_time(self) -> float:
         """Get average batch processing time"""
-        if not self.batch_times:
+        if not self.batch_count:
             return 0.0
-        return sum(self.batch_times) / len(self.batch_times)
+        return self._batch_time_sum / self.batch_count
     
     def get_sentences_per_second(self) -> float:
         """Calculate processing speed"""
@@ -92,24 +182,52 @@ class PerformanceMetrics:
             return 100.0
         return ((self.total_sentences - self.validation_failures) / self.total_sentences) * 100
     
+    def _summary_key(self) -> tuple:
+        """Snapshot of every value get_summary() depends on"""
+        return (
+            self.start_time, self.end_time, self.cpu_time,
+            self.extraction_time, self.processing_time, self.validation_time,
+            self.total_sentences, self.direct_sentences, self.ai_rewrites,
+            self.mechanical_fallbacks, self.validation_failures,
+            self.api_calls, self.cache_hits, self.tokens_used,
+            self.batch_count, self._batch_size_sum, self._batch_time_sum,
+            self.estimated_cost, self.actual_cost
+        )
+    
     def get_summary(self) -> Dict[str, Any]:
         """
         Generate comprehensive performance summary
         
+        The result is cached and reused until one of the metrics changes.
+        
         Returns:
             Dictionary with all performance metrics
         """
+        key = self._summary_key()
+        if self._summary_cache is not None and self._summary_cache[0] == key:
+            return self._summary_cache[1]
+        
         total_time = self.get_total_time()
+        total = self.total_sentences
+        inv_time = 100.0 / total_time if total_time > 0 else 0.0
+        inv_total = 100.0 / total if total > 0 else 0.0
         
-        return {
+        def share_of_time(seconds: float) -> str:
+            return f"{seconds:.1f}s ({seconds * inv_time:.0f}%)" if total_time > 0 else "0s"
+        
+        def share_of_sentences(count: int) -> str:
+            return f"{count} ({count * inv_total:.1f}%)" if total > 0 else "0"
+        
+        summary = {
             'speed': {
                 'total_time': f"{total_time:.2f}s",
                 'total_minutes': f"{total_time / 60:.1f}min",
+                'cpu_time': f"{self.cpu_time:.2f}s",
                 'sentences_per_second': f"{self.get_sentences_per_second():.1f}",
                 'time_breakdown': {
-                    'extraction': f"{self.extraction_time:.1f}s ({self.extraction_time/total_time*100:.0f}%)" if total_time > 0 else "0s",
-                    'processing': f"{self.processing_time:.1f}s ({self.processing_time/total_time*100:.0f}%)" if total_time > 0 else "0s",
-                    'validation': f"{self.validation_time:.1f}s ({self.validation_time/total_time*100:.0f}%)" if total_time > 0 else "0s"
+                    'extraction': share_of_time(self.extraction_time),
+                    'processing': share_of_time(self.processing_time),
+                    'validation': share_of_time(self.validation_time)
                 }
             },
             'efficiency': {
@@ -118,22 +236,25 @@ class PerformanceMetrics:
                 'api_calls': self.api_calls,
                 'avg_batch_size': f"{self.get_avg_batch_size():.1f}",
                 'avg_batch_time': f"{self.get_avg_batch_time():.2f}s",
-                'tokens_per_sentence': f"{self.tokens_used / self.total_sentences:.0f}" if self.total_sentences > 0 else "0"
+                'tokens_per_sentence': f"{self.tokens_used / total:.0f}" if total > 0 else "0"
             },
             'quality': {
-                'total_sentences': self.total_sentences,
-                'direct_pass': f"{self.direct_sentences} ({self.direct_sentences / self.total_sentences * 100:.1f}%)" if self.total_sentences > 0 else "0",
-                'ai_rewritten': f"{self.ai_rewrites} ({self.ai_rewrites / self.total_sentences * 100:.1f}%)" if self.total_sentences > 0 else "0",
-                'mechanical_fallback': f"{self.mechanical_fallbacks} ({self.mechanical_fallbacks / self.total_sentences * 100:.1f}%)" if self.total_sentences > 0 else "0",
+                'total_sentences': total,
+                'direct_pass': share_of_sentences(self.direct_sentences),
+                'ai_rewritten': share_of_sentences(self.ai_rewrites),
+                'mechanical_fallback': share_of_sentences(self.mechanical_fallbacks),
                 'validation_failures': self.validation_failures,
                 'success_rate': f"{self.get_success_rate():.1f}%"
             },
             'cost': {
                 'estimated': f"${self.estimated_cost:.2f}",
                 'actual': f"${self.actual_cost:.2f}",
-                'cost_per_sentence': f"${self.actual_cost / self.total_sentences:.4f}" if self.total_sentences > 0 else "$0.0000"
+                'cost_per_sentence': f"${self.actual_cost / total:.4f}" if total > 0 else "$0.0000"
             }
         }
+        
+        self._summary_cache = (key, summary)
+        return summary
     
     def print_summary(self):
         """Print formatted performance summary"""
@@ -145,6 +266,7 @@ class PerformanceMetrics:
         
         print(f"\n⏱️  SPEED METRICS")
         print(f"   Total Time:              {summary['speed']['total_time']} ({summary['speed']['total_minutes']})")
+        print(f"   CPU Time:                {summary['speed']['cpu_time']}")
         print(f"   Processing Speed:        {summary['speed']['sentences_per_second']} sentences/sec")
         print(f"   Time Breakdown:")
         print(f"     - Extraction:          {summary['speed']['time_breakdown']['extraction']}")
@@ -1,15 +1,220 @@
 """
 Sentence Cache Module
-Simple LRU cache for AI-rewritten sentences to improve performance
+Simple LRU (or W-TinyLFU) cache for AI-rewritten sentences to improve
+performance, optionally backed by a SQLite file so rewrites survive
+across runs
 """
 
 import re
+import sys
+import json
+import time
+import sqlite3
 import logging
-from typing import List, Optional, Dict
+import functools
+import threading
+from typing import Any, List, Optional, Dict
 from collections import OrderedDict
+from src.utils.performance_metrics import AtomicCounter
 
 logger = logging.getLogger(__name__)
 
+_WS_RE = re.compile(r'\s+')
+
+# Fold typographic quotes to their ASCII forms in a single pass
+_QUOTE_TABLE = str.maketrans({
+    '\u201C': '"',
+    '\u201D': '"',
+    '\u00AB': '"',
+    '\u00BB': '"',
+    '\u2018': "'",
+    '\u2019': "'",
+})
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_sentence(sentence: str) -> str:
+    """
+    Build the cache key for a sentence (memoized: get() and put() are
+    usually called with the same sentence back to back)
+    
+    Keys are interned, so a sentence repeated throughout a novel shares
+    one key string between the memo, the in-memory store and callers.
+    
+    Args:
+        sentence: Original sentence
+        
+    Returns:
+        Normalized sentence
+    """
+    # Fast path: plain ASCII with only single spaces has no quotes to
+    # fold and no whitespace runs to collapse
+    if sentence.isascii() and sentence.isprintable() and '  ' not in sentence:
+        return sys.intern(sentence.strip().lower())
+    
+    # Remove extra whitespace
+    normalized = _WS_RE.sub(' ', sentence.strip())
+    
+    # Convert to lowercase for case-insensitive matching
+    normalized = normalized.lower()
+    
+    # Remove some punctuation variations for better matching
+    normalized = normalized.translate(_QUOTE_TABLE)
+    
+    return sys.intern(normalized)
+
+
+# Trim the persistent store back to db_max_size after this many writes
+_DB_TRIM_INTERVAL = 100
+
+# Odd 64-bit multipliers giving the count-min sketch its row hashes
+_SKETCH_SEEDS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0xD6E8FEB86659FD93)
+_MASK64 = (1 << 64) - 1
+_SKETCH_MAX_COUNT = 15  # 4-bit counters
+
+
+class _FrequencySketch:
+    """
+    Count-min sketch estimating how often each key was looked up
+    
+    Counters saturate at 15 and are all halved once 10 x capacity
+    increments have been recorded, so old popularity fades out.
+    """
+    
+    def __init__(self, capacity: int):
+        """
+        Initialize sketch
+        
+        Args:
+            capacity: Number of entries the owning cache holds
+        """
+        width = 1 << max(4, (4 * capacity - 1).bit_length())
+        self._mask = width - 1
+        self._rows = [bytearray(width) for _ in _SKETCH_SEEDS]
+        self._sample_size = 10 * max(capacity, 1)
+        self._additions = 0
+    
+    def _indexes(self, key: str) -> List[int]:
+        """Counter index of key in each row"""
+        h = hash(key)
+        return [(((h * seed) & _MASK64) >> 32) & self._mask for seed in _SKETCH_SEEDS]
+    
+    def increment(self, key: str):
+        """Record one access to key"""
+        for row, index in zip(self._rows, self._indexes(key)):
+            if row[index] < _SKETCH_MAX_COUNT:
+                row[index] += 1
+        
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._rows = [bytearray(count >> 1 for count in row) for row in self._rows]
+            self._additions //= 2
+    
+    def estimate(self, key: str) -> int:
+        """Estimated access count of key"""
+        return min(row[index] for row, index in zip(self._rows, self._indexes(key)))
+    
+    def clear(self):
+        """Forget all recorded accesses"""
+        for row in self._rows:
+            row[:] = bytes(len(row))
+        self._additions = 0
+
+
+class _TinyLFUStore:
+    """
+    W-TinyLFU entry store
+    
+    New entries go to a small LRU window (1% of capacity). An entry pushed
+    out of the window only enters the main segmented LRU if it has been
+    looked up more often than the entry it would evict, so sentences seen
+    once don't displace frequently repeated ones. The main area keeps
+    re-used entries in a protected segment (80%) and the rest on probation.
+    """
+    
+    def __init__(self, max_size: int):
+        """
+        Initialize store
+        
+        Args:
+            max_size: Maximum number of entries
+        """
+        self.max_size = max_size
+        self.window_size = max(1, max_size // 100)
+        self.main_size = max(0, max_size - self.window_size)
+        self.protected_size = int(self.main_size * 0.8)
+        
+        self.window: OrderedDict[str, Any] = OrderedDict()
+        self.probation: OrderedDict[str, Any] = OrderedDict()
+        self.protected: OrderedDict[str, Any] = OrderedDict()
+        self.sketch = _FrequencySketch(max_size)
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Look up key, recording the access"""
+        self.sketch.increment(key)
+        return self._touch(key)
+    
+    def _touch(self, key: str) -> Optional[Any]:
+        """Mark key as most recently used, promoting it out of probation"""
+        if key in self.window:
+            self.window.move_to_end(key)
+            return self.window[key]
+        
+        if key in self.protected:
+            self.protected.move_to_end(key)
+            return self.protected[key]
+        
+        if key in self.probation:
+            value = self.probation.pop(key)
+            self.protected[key] = value
+            if len(self.protected) > self.protected_size:
+                demoted_key, demoted_value = self.protected.popitem(last=False)
+                self.probation[demoted_key] = demoted_value
+            return value
+        
+        return None
+    
+    def put(self, key: str, value: Any):
+        """Insert or replace key"""
+        for segment in (self.window, self.protected, self.probation):
+            if key in segment:
+                segment[key] = value
+                self._touch(key)
+                return
+        
+        self.window[key] = value
+        if len(self.window) > self.window_size:
+            self._admit(*self.window.popitem(last=False))
+    
+    def _admit(self, key: str, value: Any):
+        """Move an entry leaving the window into the main area if it earns a slot"""
+        if len(self.probation) + len(self.protected) < self.main_size:
+            self.probation[key] = value
+            return
+        
+        victims = self.probation or self.protected
+        if not victims:
+            return
+        
+        victim = next(iter(victims))
+        if self.sketch.estimate(key) > self.sketch.estimate(victim):
+            del victims[victim]
+            self.probation[key] = value
+            logger.debug("Cache full, evicted less frequently used entry")
+    
+    def clear(self):
+        """Remove all entries and access history"""
+        self.window.clear()
+        self.probation.clear()
+        self.protected.clear()
+        self.sketch.clear()
+    
+    def __len__(self) -> int:
+        return len(self.window) + len(self.probation) + len(self.protected)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self.window or key in self.protected or key in self.probation
+
 
 class SentenceCache:
     """
@@ -17,87 +222,218 @@ class SentenceCache:
     
     Caches AI-rewritten sentences to avoid redundant API calls
     for identical or similar sentences (e.g., repeated dialogue, common phrases)
+    
+    policy='tinylfu' swaps the LRU for W-TinyLFU eviction, which keeps
+    often-repeated sentences cached instead of letting one-off sentences
+    push them out.
+    
+    When db_path is given, every rewrite is also written through to a SQLite
+    database (WAL mode) and misses in the in-memory LRU fall back to it, so
+    a later run starts warm instead of re-requesting the same sentences.
     """
     
-    def __init__(self, max_size: int = 500):
+    def __init__(self, max_size: int = 500, db_path: Optional[str] = None,
+                 namespace: str = '', db_max_size: int = 50000, policy: str = 'lru'):
         """
         Initialize cache
         
         Args:
-            max_size: Maximum number of sentences to cache
+            max_size: Maximum number of sentences to keep in memory
+            db_path: Optional SQLite file for the persistent store
+            namespace: Keeps entries apart in a shared store (e.g. rewrites
+                made for different word limits)
+            db_max_size: Maximum number of sentences kept in the store
+            policy: In-memory eviction policy, 'lru' or 'tinylfu'
         """
+        if policy not in ('lru', 'tinylfu'):
+            raise ValueError(f"Unknown cache policy: {policy}")
+        
         self.max_size = max_size
-        self.cache: OrderedDict[str, List[str]] = OrderedDict()
-        self.hits: int = 0
-        self.misses: int = 0
+        self.policy = policy
+        self._lru = policy == 'lru'
+        self.cache = OrderedDict() if self._lru else _TinyLFUStore(max_size)
+        self._hits = AtomicCounter()
+        self._misses = AtomicCounter()
+        
+        self.namespace = namespace
+        self.db_max_size = db_max_size
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._writes_since_trim = 0
+        if db_path:
+            self._open_db(db_path)
     
-    def _normalize(self, sentence: str) -> str:
+    def _open_db(self, db_path: str):
+        """
+        Open (and create if needed) the persistent store
+        
+        A store that cannot be opened is logged and skipped; the cache then
+        behaves as a plain in-memory LRU.
+        
+        Args:
+            db_path: SQLite file path
+        """
+        try:
+            db = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('PRAGMA synchronous=NORMAL')
+            db.execute(
+                'CREATE TABLE IF NOT EXISTS sentence_cache ('
+                'namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, '
+                'last_used INTEGER NOT NULL, PRIMARY KEY (namespace, key))'
+            )
+            db.execute(
+                'CREATE INDEX IF NOT EXISTS sentence_cache_last_used '
+                'ON sentence_cache (last_used)'
+            )
+        except sqlite3.Error as error:
+            logger.warning(f"Persistent sentence cache disabled ({db_path}): {error}")
+            return
+        self._db = db
+    
+    def _db_get(self, normalized: str) -> Optional[List[str]]:
+        """Look a key up in the persistent store and mark it as used"""
+        try:
+            with self._db_lock:
+                row = self._db.execute(
+                    'SELECT value FROM sentence_cache WHERE namespace = ? AND key = ?',
+                    (self.namespace, normalized)
+                ).fetchone()
+                if row is None:
+                    return None
+                self._db.execute(
+                    'UPDATE sentence_cache SET last_used = ? WHERE namespace = ? AND key = ?',
+                    (int(time.time()), self.namespace, normalized)
+                )
+        except sqlite3.Error as error:
+            logger.warning(f"Persistent sentence cache read failed: {error}")
+            return None
+        return json.loads(row[0])
+    
+    def _db_put(self, normalized: str, rewritten: List[str]):
+        """Write an entry through to the persistent store"""
+        try:
+            with self._db_lock:
+                self._db.execute(
+                    'INSERT OR REPLACE INTO sentence_cache (namespace, key, value, last_used) '
+                    'VALUES (?, ?, ?, ?)',
+                    (self.namespace, normalized, json.dumps(rewritten), int(time.time()))
+                )
+                self._writes_since_trim += 1
+                if self._writes_since_trim >= _DB_TRIM_INTERVAL:
+                    self._writes_since_trim = 0
+                    self._db.execute(
+                        'DELETE FROM sentence_cache WHERE rowid IN ('
+                        'SELECT rowid FROM sentence_cache ORDER BY last_used ASC '
+                        'LIMIT max(0, (SELECT COUNT(*) FROM sentence_cache) - ?))',
+                        (self.db_max_size,)
+                    )
+        except sqlite3.Error as error:
+            logger.warning(f"Persistent sentence cache write failed: {error}")
+    
+    def close(self):
+        """Close the persistent store (the in-memory cache stays usable)"""
+        if self._db is not None:
+            with self._db_lock:
+                self._db.close()
+            self._db = None
+    
+    @property
+    def hits(self) -> int:
+        """Number of cache hits"""
+        return self._hits.value
+    
+    @property
+    def misses(self) -> int:
+        """Number of cache misses"""
+        return self._misses.value
+    
+    @staticmethod
+    def normalize(sentence: str) -> str:
         """
         Normalize sentence for consistent cache lookup
         
+        Callers that look up and store the same sentence can compute this
+        once and pass it as key= to get() and put().
+        
         Args:
             sentence: Original sentence
             
         Returns:
-            Normalized sentence
+            Normalized (interned) sentence
         """
-        # Remove extra whitespace
-        normalized = re.sub(r'\s+', ' ', sentence.strip())
-        
-        # Convert to lowercase for case-insensitive matching
-        normalized = normalized.lower()
-        
-        # Remove some punctuation variations for better matching
-        normalized = normalized.replace('"', '"').replace('"', '"')
-        normalized = normalized.replace("'", "'").replace("'", "'")
-        
-        return normalized
+        return _normalize_sentence(sentence)
     
-    def get(self, sentence: str) -> Optional[List[str]]:
+    def get(self, sentence: str, key: Optional[str] = None) -> Optional[List[str]]:
         """
         Get cached rewrite for sentence
         
         Args:
             sentence: Sentence to look up
+            key: Precomputed normalize(sentence), if the caller has it
             
         Returns:
             Cached rewritten sentences or None if not found
         """
-        normalized = self._normalize(sentence)
+        normalized = key if key is not None else _normalize_sentence(sentence)
         
-        if normalized in self.cache:
-            self.hits += 1
-            # Move to end (most recently used)
-            self.cache.move_to_end(normalized)
-            return self.cache[normalized]
+        rewritten = self.cache.get(normalized)
+        if rewritten is not None:
+            self._hits.increment()
+            if self._lru:
+                # Move to end (most recently used)
+                self.cache.move_to_end(normalized)
+            return rewritten
         
-        self.misses += 1
+        if self._db is not None:
+            rewritten = self._db_get(normalized)
+            if rewritten is not None:
+                self._hits.increment()
+                self._remember(normalized, rewritten)
+                return rewritten
+        
+        self._misses.increment()
         return None
     
-    def put(self, sentence: str, rewritten: List[str]):
+    def put(self, sentence: str, rewritten: List[str], key: Optional[str] = None):
         """
         Cache a sentence rewrite
         
         Args:
             sentence: Original sentence
             rewritten: List of rewritten sentences
+            key: Precomputed normalize(sentence), if the caller has it
         """
-        normalized = self._normalize(sentence)
+        normalized = key if key is not None else _normalize_sentence(sentence)
+        self._remember(normalized, rewritten)
+        if self._db is not None:
+            self._db_put(normalized, rewritten)
+    
+    def _remember(self, normalized: str, rewritten: List[str]):
+        """Insert into the in-memory store, evicting an entry if full"""
+        if not self._lru:
+            self.cache.put(normalized, rewritten)
+            return
+        
+        if normalized in self.cache:
+            # Re-caching an entry counts as a use
+            self.cache[normalized] = rewritten
+            self.cache.move_to_end(normalized)
+            return
         
         # Remove oldest entry if cache is full
         if len(self.cache) >= self.max_size:
             # Remove least recently used (first item)
-            oldest_key = next(iter(self.cache))
-            del self.cache[oldest_key]
+            self.cache.popitem(last=False)
             logger.debug(f"Cache full, evicted oldest entry")
         
         self.cache[normalized] = rewritten
     
     def clear(self):
-        """Clear the cache"""
+        """Clear the in-memory cache and statistics (the persistent store is kept)"""
         self.cache.clear()
-        self.hits = 0
-        self.misses = 0
+        self._hits = AtomicCounter()
+        self._misses = AtomicCounter()
     
     def get_stats(self) -> Dict[str, any]:
         """
@@ -106,14 +442,16 @@ class SentenceCache:
         Returns:
             Dictionary with cache stats
         """
-        total_requests = self.hits + self.misses
-        hit_rate = (self.hits / total_requests * 100) if total_requests > 0 else 0.0
+        hits = self.hits
+        misses = self.misses
+        total_requests = hits + misses
+        hit_rate = (hits / total_requests * 100) if total_requests > 0 else 0.0
         
         return {
             'size': len(self.cache),
             'max_size': self.max_size,
-            'hits': self.hits,
-            'misses': self.misses,
+            'hits': hits,
+            'misses': misses,
             'total_requests': total_requests,
             'hit_rate': hit_rate,
             'utilization': (len(self.cache) / self.max_size * 100) if self.max_size > 0 else 0.0
@@ -125,5 +463,4 @@ class SentenceCache:
     
     def __contains__(self, sentence: str) -> bool:
         """Check if sentence is in cache"""
-        normalized = self._normalize(sentence)
-        return normalized in self.cache
+        return _normalize_sentence(sentence) in self.cache
@@ -6,6 +6,41 @@ Functions here should be conservative and language-aware for French text.
 
 import re
 
+# All OCR repairs in a single alternation so the text is scanned once:
+#   hyphen  - de-hyphenate across line breaks/spaces: "philo-\n sophe"
+#   elision - spaced apostrophe after an elided word: "d ' accord",
+#             "qu ' il", "jusqu ' à", "aujourd ' hui"
+#   apos    - any other spaced apostrophe between letters: "l ' été"
+_REPAIR_RE = re.compile(
+    r"(?P<hyphen>(?<=\w)[\-‑]\s+(?=\w))"
+    r"|(?P<elision>\b(?:[dljmtscnqDLJMTSCNQ]|[Qq]u|[Jj]usqu|[Ll]orsqu|[Pp]uisqu|[Pp]resqu|[Aa]ujourd)\s*'\s+)"
+    r"|(?P<apos>\b[A-Za-z]\s+'\s+(?=[A-Za-z]))"
+)
+
+# Single-pass typography normalization: ’ → ', “ ” « » → ", NBSP → space
+_TRANS = str.maketrans({
+    "\u2019": "'",
+    "\u201C": '"',
+    "\u201D": '"',
+    "\u00AB": '"',
+    "\u00BB": '"',
+    "\u00A0": " ",
+})
+_TRANS_CHARS = frozenset("\u2019\u201C\u201D\u00AB\u00BB\u00A0")
+
+
+def _repair(match: "re.Match") -> str:
+    """Replacement for one _REPAIR_RE match"""
+    kind = match.lastgroup
+    if kind == "hyphen":
+        return ""
+    # Single-letter elisions are lowercased ("L ' été" -> "l'été");
+    # longer words keep their case ("Qu ' il" -> "Qu'il")
+    word = match.group().split("'", 1)[0].rstrip()
+    if kind == "elision" and len(word) == 1:
+        word = word.lower()
+    return word + "'"
+
 
 def clean_text_for_ai(text: str) -> str:
     """
@@ -25,31 +60,12 @@ def clean_text_for_ai(text: str) -> str:
     if not text:
         return ""
 
-    t = text
-
-    # 1) De-hyphenate words split across line breaks or spaces (common in OCR)
-    #    Pattern: word-\s*\n\s*word  OR  word-\s+word
-    t = re.sub(r"(\w)[\-‑]\s*\n\s*(\w)", r"\1\2", t)  # hyphen + newline
-    t = re.sub(r"(\w)[\-‑]\s+(\w)", r"\1\2", t)        # hyphen + spaces
-
-    # 2) Normalize quotes and apostrophes
-    t = t.replace("’", "'")
-    t = t.replace("“", '"').replace("”", '"')
-    t = t.replace("«", '"').replace("»", '"')
-
-    # 3) Fix spaced apostrophes in French elisions: d ' accord -> d'accord
-    #    Handle common single-letter elisions and a few two-letter ones
-    t = re.sub(r"\b([dljmtscnqD L J M T S C N Q])\s*'\s+", lambda m: m.group(1).strip().lower() + "'", t)
-    # Also fix l ’ espace with fancy apostrophes already normalized
-    t = re.sub(r"\b([A-Za-z])\s+'\s+([A-Za-z])", r"\1'\2", t)
-
-    # 4) Collapse multiple whitespace and normalize newlines to spaces
-    #    Keep sentence punctuation as-is; just clean spacing
-    t = t.replace("\u00A0", " ")  # non-breaking space
-    # Replace multiple newlines with a single space to keep flow
-    t = re.sub(r"[\r\n]+", " ", t)
-    # Collapse remaining multiple spaces
-    t = re.sub(r"\s+", " ", t)
-    t = t.strip()
-
-    return t
+    # 1) Normalize quotes, apostrophes and non-breaking spaces in one pass
+    #    (skipped, with its full copy, when none of them occur)
+    t = text if _TRANS_CHARS.isdisjoint(text) else text.translate(_TRANS)
+
+    # 2) De-hyphenate split words and fix spaced apostrophes in one pass
+    t = _REPAIR_RE.sub(_repair, t)
+
+    # 3) Collapse all whitespace (newlines included) to single spaces and trim
+    return " ".join(t.split())
@@ -51,6 +51,149 @@ def test_config_manager():
         return False
 
 
+def test_config_transaction():
+    """Test that a transaction writes once and rolls back on error"""
+    print("\nTesting ConfigManager transactions...")
+    try:
+        import shutil
+        import tempfile
+        from unittest import mock
+        from src.utils.config_manager import ConfigManager
+        
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp_dir, "config.ini")
+            config = ConfigManager(path)
+            
+            # Several setters inside a transaction produce a single write
+            with mock.patch("src.utils.config_manager.os.replace", wraps=os.replace) as replace:
+                with config.transaction():
+                    config.set_word_limit(20)
+                    config.set_processing_mode("mechanical_chunking")
+                    assert replace.call_count == 0
+            assert replace.call_count == 1
+            assert ConfigManager(path).get_word_limit() == 20
+            
+            # An exception discards the pending changes and skips the write
+            with mock.patch("src.utils.config_manager.os.replace", wraps=os.replace) as replace:
+                try:
+                    with config.transaction():
+                        config.set_word_limit(30)
+                        config.set_processing_mode("ai_rewrite")
+                        raise ValueError("abort")
+                except ValueError:
+                    pass
+            assert replace.call_count == 0
+            assert config.get_word_limit() == 20
+            assert config.get_processing_mode() == "mechanical_chunking"
+            assert ConfigManager(path).get_word_limit() == 20
+        finally:
+            shutil.rmtree(tmp_dir)
+        
+        print("✓ ConfigManager transactions working correctly")
+        return True
+    except Exception as e:
+        print(f"✗ ConfigManager transaction error: {e}")
+        return False
+
+
+def test_config_skip_unchanged():
+    """Test that setting an unchanged value does not rewrite the file"""
+    print("\nTesting ConfigManager unchanged values...")
+    try:
+        import shutil
+        import tempfile
+        from unittest import mock
+        from src.utils.config_manager import ConfigManager
+        
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            config = ConfigManager(os.path.join(tmp_dir, "config.ini"))
+            config.set_word_limit(12)
+            
+            with mock.patch.object(config, "save_config", wraps=config.save_config) as save:
+                config.set_word_limit(12)
+                assert save.call_count == 0
+                config.set_word_limit(13)
+                assert save.call_count == 1
+        finally:
+            shutil.rmtree(tmp_dir)
+        
+        print("✓ Unchanged values are not saved")
+        return True
+    except Exception as e:
+        print(f"✗ ConfigManager unchanged value error: {e}")
+        return False
+
+
+def test_config_atomic_save():
+    """Test that the config is written to a temp file and swapped in"""
+    print("\nTesting ConfigManager atomic save...")
+    try:
+        import shutil
+        import tempfile
+        from unittest import mock
+        from src.utils.config_manager import ConfigManager
+        
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp_dir, "config.ini")
+            config = ConfigManager(path)
+            
+            with mock.patch("src.utils.config_manager.os.replace", wraps=os.replace) as replace:
+                config.set_word_limit(15)
+            replace.assert_called_once_with(path + ".tmp", path)
+            assert not os.path.exists(path + ".tmp")
+            assert ConfigManager(path).get_word_limit() == 15
+        finally:
+            shutil.rmtree(tmp_dir)
+        
+        print("✓ Config saved atomically")
+        return True
+    except Exception as e:
+        print(f"✗ ConfigManager atomic save error: {e}")
+        return False
+
+
+def test_config_parse_cache():
+    """Test that an unchanged config file is not parsed again"""
+    print("\nTesting ConfigManager parse cache...")
+    try:
+        import configparser
+        import shutil
+        import tempfile
+        from unittest import mock
+        from src.utils.config_manager import ConfigManager
+        
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp_dir, "config.ini")
+            ConfigManager(path).set_word_limit(16)
+            ConfigManager(path)
+            
+            # Same mtime: served from the cache without configparser.read
+            with mock.patch.object(configparser.ConfigParser, "read") as read:
+                assert ConfigManager(path).get_word_limit() == 16
+                assert not read.called
+            
+            # Edited on disk (new mtime): parsed again
+            with open(path) as f:
+                text = f.read()
+            with open(path, "w") as f:
+                f.write(text.replace("default_word_limit = 16", "default_word_limit = 17"))
+            stat = os.stat(path)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            assert ConfigManager(path).get_word_limit() == 17
+        finally:
+            shutil.rmtree(tmp_dir)
+        
+        print("✓ Config parse cache working correctly")
+        return True
+    except Exception as e:
+        print(f"✗ ConfigManager parse cache error: {e}")
+        return False
+
+
 def test_validator():
     """Test sentence validator"""
     print("\nTesting SentenceValidator...")
@@ -78,6 +221,42 @@ def test_validator():
         return False
 
 
+def test_validator_language():
+    """Test the validator's French language check"""
+    print("\nTesting SentenceValidator language check...")
+    try:
+        from unittest import mock
+        from src.utils.validator import SentenceValidator
+        
+        validator = SentenceValidator(word_limit=8)
+        
+        # Clear-cut cases are settled by function-word scoring, without
+        # language detection
+        with mock.patch("src.utils.validator._is_french_detected") as detect:
+            # Short French lines with English loanwords
+            assert validator.is_french("Il fait du jogging avec son coach")
+            assert validator.is_french("On mange un sandwich dans ce snack")
+            assert validator.is_french("Le weekend il regarde un film")
+            assert validator.is_french("Un job cool")
+            # Mixed sentences where French function words dominate
+            assert validator.is_french("He said que tout va bien pour nous")
+            # Pure English
+            assert not validator.is_french("The cat is sleeping on the sofa")
+            assert not validator.is_french("It was the best of times")
+            assert not detect.called
+            
+            # Evenly mixed vocabulary is left to language detection
+            detect.return_value = True
+            assert validator.is_french("The weekend was fun pour nous")
+            detect.assert_called_once_with("The weekend was fun pour nous")
+        
+        print("✓ SentenceValidator language check working correctly")
+        return True
+    except Exception as e:
+        print(f"✗ SentenceValidator language check error: {e}")
+        return False
+
+
 def test_sentence_splitter_mechanical():
     """Test sentence splitter in mechanical mode"""
     print("\nTesting SentenceSplitter (mechanical mode)...")
@@ -149,7 +328,12 @@ def run_all_tests():
     tests = [
         test_imports,
         test_config_manager,
+        test_config_transaction,
+        test_config_skip_unchanged,
+        test_config_atomic_save,
+        test_config_parse_cache,
         test_validator,
+        test_validator_language,
         test_sentence_splitter_mechanical,
         test_ai_rewriter_mock
     ]
@@ -59,6 +59,15 @@ def test_authentication():
         return None
 
 
+# Sample data
+TEST_DATA = [
+    ['Row', 'Sentence', 'Original', 'Method', 'Word_Count'],
+    [1, 'Le chat dort.', 'Le chat dort paisiblement sur le canapé.', 'AI-Rewritten', 3],
+    [2, 'Il fait beau.', 'Il fait beau aujourd\'hui.', 'Direct', 3],
+    [3, 'La voiture est rouge.', 'La voiture garée là-bas est rouge.', 'Mechanical', 4]
+]
+
+
 def test_create_spreadsheet(sheets_manager):
     """Test creating a Google Spreadsheet"""
     print("\n" + "=" * 60)
@@ -68,7 +77,12 @@ def test_create_spreadsheet(sheets_manager):
     try:
         print("\n⏳ Creating test spreadsheet...")
         
-        result = sheets_manager.create_spreadsheet("Test Spreadsheet - French Novel Processor")
+        # Data and the frozen header row ship inline with the create call
+        result = sheets_manager.create_spreadsheet(
+            "Test Spreadsheet - French Novel Processor",
+            initial_rows=TEST_DATA,
+            frozen_row_count=1
+        )
         
         print(f"\n✓ Spreadsheet created successfully!")
         print(f"📊 Spreadsheet ID: {result['spreadsheet_id']}")
@@ -92,15 +106,28 @@ def test_write_data(sheets_manager, spreadsheet_id):
     try:
         print("\n⏳ Writing test data...")
         
-        # Sample data
-        data = [
-            ['Row', 'Sentence', 'Original', 'Method', 'Word_Count'],
-            [1, 'Le chat dort.', 'Le chat dort paisiblement sur le canapé.', 'AI-Rewritten', 3],
-            [2, 'Il fait beau.', 'Il fait beau aujourd\'hui.', 'Direct', 3],
-            [3, 'La voiture est rouge.', 'La voiture garée là-bas est rouge.', 'Mechanical', 4]
-        ]
-        
-        sheets_manager.write_data(spreadsheet_id, 'Sheet1', data)
+        # Written below the rows sent with create_spreadsheet, so both the
+        # inline rows and this write can be read back
+        start_row = len(TEST_DATA) + 2
+        sheets_manager.write_data(spreadsheet_id, 'Sheet1', TEST_DATA, start_cell=f'A{start_row}')
+        
+        print("⏳ Reading back test data...")
+        
+        ranges = {
+            'create_spreadsheet': f'Sheet1!A1:E{len(TEST_DATA)}',
+            'write_data': f'Sheet1!A{start_row}:E{start_row + len(TEST_DATA) - 1}'
+        }
+        for source, cell_range in ranges.items():
+            result = sheets_manager.service.spreadsheets().values().get(
+                spreadsheetId=spreadsheet_id,
+                range=cell_range,
+                valueRenderOption='UNFORMATTED_VALUE'
+            ).execute()
+            values = result.get('values', [])
+            
+            if values != TEST_DATA:
+                print(f"❌ Unexpected contents written by {source}: {values}")
+                return False
         
         print("✓ Data written successfully!")
         
@@ -128,30 +155,25 @@ def test_formatting(sheets_manager, spreadsheet_id):
             print("❌ Could not find sheet ID")
             return False
         
-        # Apply header formatting
-        sheets_manager.apply_header_formatting(
-            spreadsheet_id,
-            sheet_id,
-            5,  # 5 columns
-            {'red': 0.27, 'green': 0.45, 'blue': 0.77}  # Blue
-        )
-        print("  ✓ Header formatting applied")
-        
-        # Apply borders
-        sheets_manager.apply_borders(spreadsheet_id, sheet_id, 4, 5)
-        print("  ✓ Borders applied")
-        
-        # Freeze header row
-        sheets_manager.freeze_rows(spreadsheet_id, sheet_id, 1)
-        print("  ✓ Header row frozen")
-        
-        # Set column widths
-        sheets_manager.set_column_widths(
-            spreadsheet_id,
-            sheet_id,
-            {0: 60, 1: 400, 2: 400, 3: 150, 4: 100}
-        )
-        print("  ✓ Column widths set")
+        # Queue all four formatting steps and send them as one batchUpdate
+        with sheets_manager.formatting_batch(spreadsheet_id, sheet_id) as batch:
+            sheets_manager.apply_header_formatting(
+                spreadsheet_id,
+                sheet_id,
+                5,  # 5 columns
+                {'red': 0.27, 'green': 0.45, 'blue': 0.77},  # Blue
+                batch=batch
+            )
+            sheets_manager.apply_borders(spreadsheet_id, sheet_id, 4, 5, batch=batch)
+            sheets_manager.set_column_widths(
+                spreadsheet_id,
+                sheet_id,
+                {0: 60, 1: 400, 2: 400, 3: 150, 4: 100},
+                batch=batch
+            )
+            print(f"  ✓ {len(batch)} formatting requests queued")
+        
+        print("  ✓ Header formatting, borders and column widths applied")
         
         print("\n✓ All formatting applied successfully!")
         
@@ -4,9 +4,16 @@ Validates that optimization features work correctly
 """
 
 import unittest
+from unittest import mock
+import httplib2
+from googleapiclient.errors import HttpError
 from src.core.sentence_splitter import SentenceSplitter, ProcessingMode
 from src.utils.sentence_cache import SentenceCache
 from src.utils.performance_metrics import PerformanceMetrics
+from src.utils.text_cleaner import clean_text_for_ai
+from src.utils import google_sheets
+from src.utils.google_sheets import GoogleSheetsManager, _TokenBucket, _chunk_writes, _offset_cell
+from src.utils.validator import SentenceValidator, _ORIG_KEYS_CACHE_SIZE
 
 
 class TestSentenceCache(unittest.TestCase):
@@ -43,6 +50,15 @@ class TestSentenceCache(unittest.TestCase):
         result = self.cache.get(sentence2)
         self.assertIsNotNone(result)  # Should find it despite case difference
     
+    def test_cache_precomputed_key(self):
+        """Test get/put with a key from SentenceCache.normalize"""
+        key = SentenceCache.normalize("  Le  Chat dort. ")
+        self.assertIs(key, SentenceCache.normalize("le chat DORT."))
+        
+        self.cache.put("  Le  Chat dort. ", ["Le chat dort."], key=key)
+        self.assertEqual(self.cache.get("le chat dort.", key=key), ["Le chat dort."])
+        self.assertEqual(self.cache.get("LE CHAT DORT."), ["Le chat dort."])
+    
     def test_cache_eviction(self):
         """Test LRU eviction"""
         # Fill cache to max
@@ -60,6 +76,44 @@ class TestSentenceCache(unittest.TestCase):
         result = self.cache.get("Sentence 10")
         self.assertIsNotNone(result)
     
+    def test_cache_put_refreshes_recency(self):
+        """Test that re-caching an entry protects it from eviction"""
+        for i in range(10):
+            self.cache.put(f"Sentence {i}", [f"Rewritten {i}"])
+        
+        # Re-put the oldest entry, then overflow the cache
+        self.cache.put("Sentence 0", ["Rewritten 0 again"])
+        self.cache.put("Sentence 10", ["Rewritten 10"])
+        
+        self.assertEqual(self.cache.get("Sentence 0"), ["Rewritten 0 again"])
+        self.assertIsNone(self.cache.get("Sentence 1"))
+    
+    def test_tinylfu_keeps_hot_sentences(self):
+        """Test that TinyLFU doesn't let one-off sentences evict hot ones"""
+        cache = SentenceCache(max_size=10, policy='tinylfu')
+        hot = [f"Hot sentence {i}" for i in range(5)]
+        
+        # Hot sentences are requested repeatedly before and between one-offs
+        for _ in range(3):
+            for sentence in hot:
+                if cache.get(sentence) is None:
+                    cache.put(sentence, [sentence])
+        
+        for i in range(50):
+            cache.put(f"One-off sentence {i}", [f"Rewritten {i}"])
+            if i % 10 == 0:
+                for sentence in hot:
+                    cache.get(sentence)
+        
+        for sentence in hot:
+            self.assertEqual(cache.get(sentence), [sentence])
+        self.assertLessEqual(len(cache), 10)
+    
+    def test_unknown_policy(self):
+        """Test that an unknown eviction policy is rejected"""
+        with self.assertRaises(ValueError):
+            SentenceCache(policy='fifo')
+    
     def test_cache_stats(self):
         """Test cache statistics"""
         # Add some entries
@@ -75,6 +129,25 @@ class TestSentenceCache(unittest.TestCase):
         self.assertEqual(stats['misses'], 1)
         self.assertEqual(stats['size'], 2)
         self.assertGreater(stats['hit_rate'], 0)
+    
+    def test_cache_persistence(self):
+        """Test rewrites survive in the SQLite store across instances"""
+        import os
+        import tempfile
+        db_path = os.path.join(tempfile.mkdtemp(), 'cache.db')
+        
+        first = SentenceCache(max_size=10, db_path=db_path, namespace='8')
+        first.put("Il pleuvait.", ["Il pleuvait."])
+        first.close()
+        
+        second = SentenceCache(max_size=10, db_path=db_path, namespace='8')
+        self.assertEqual(second.get("Il pleuvait."), ["Il pleuvait."])
+        self.assertEqual(second.hits, 1)
+        second.close()
+        
+        other = SentenceCache(max_size=10, db_path=db_path, namespace='10')
+        self.assertIsNone(other.get("Il pleuvait."))
+        other.close()
 
 
 class TestPerformanceMetrics(unittest.TestCase):
@@ -95,22 +168,77 @@ class TestPerformanceMetrics(unittest.TestCase):
         metrics.record_batch(25, 1.5)
         metrics.record_batch(30, 2.0)
         
-        self.assertEqual(len(metrics.batch_sizes), 2)
+        self.assertEqual(metrics.batch_count, 2)
         self.assertEqual(metrics.get_avg_batch_size(), 27.5)
         self.assertEqual(metrics.get_avg_batch_time(), 1.75)
     
+    def test_counters_thread_safe(self):
+        """Test counters from several threads add up exactly"""
+        import threading
+        metrics = PerformanceMetrics()
+        
+        def worker():
+            for _ in range(1000):
+                metrics.record_api_call(tokens=2)
+                metrics.record_cache_hit()
+        
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        self.assertEqual(metrics.api_calls, 4000)
+        self.assertEqual(metrics.cache_hits, 4000)
+        self.assertEqual(metrics.tokens_used, 8000)
+    
+    def test_counters_concurrent_readers(self):
+        """Test reading counters while other threads bump them"""
+        import threading
+        metrics = PerformanceMetrics()
+        done = threading.Event()
+        seen = []
+    
+        def writer():
+            for _ in range(2000):
+                metrics.record_cache_hit()
+    
+        def reader():
+            values = []
+            while not done.is_set():
+                values.append(metrics.cache_hits)
+            values.append(metrics.cache_hits)
+            seen.append(values)
+    
+        readers = [threading.Thread(target=reader) for _ in range(4)]
+        writers = [threading.Thread(target=writer) for _ in range(4)]
+        for t in readers + writers:
+            t.start()
+        for t in writers:
+            t.join()
+        done.set()
+        for t in readers:
+            t.join()
+    
+        self.assertEqual(metrics.cache_hits, 8000)
+        for values in seen:
+            self.assertEqual(values, sorted(values))
+            self.assertEqual(values[-1], 8000)
+    
     def test_timing(self):
         """Test timing functionality"""
-        import time
+        # Fake clocks: 150ms of wall time, 10ms of it on the CPU
+        wall = iter([0.0, 0.15])
+        cpu = iter([1.0, 1.01])
         
-        metrics = PerformanceMetrics()
+        metrics = PerformanceMetrics(clock=lambda: next(wall), cpu_clock=lambda: next(cpu))
         metrics.start_timer()
-        time.sleep(0.1)  # Sleep for 100ms
         metrics.end_timer()
         
         total_time = metrics.get_total_time()
-        self.assertGreater(total_time, 0.09)  # At least 90ms
-        self.assertLess(total_time, 0.2)      # Less than 200ms
+        self.assertAlmostEqual(total_time, 0.15)
+        self.assertAlmostEqual(metrics.cpu_time, 0.01)
+        self.assertLess(metrics.cpu_time, total_time)
     
     def test_summary_generation(self):
         """Test summary generation"""
@@ -194,6 +322,265 @@ class TestPrefiltering(unittest.TestCase):
         self.assertGreater(len(result.output_sentences), 1)
 
 
+class TestValidatorCache(unittest.TestCase):
+    """Test the validator's cache of original key words"""
+    
+    def setUp(self):
+        """Set up validator"""
+        self.validator = SentenceValidator(word_limit=8)
+    
+    def test_original_keys_cache_bounded(self):
+        """Test that cached key words of originals stay bounded"""
+        for i in range(_ORIG_KEYS_CACHE_SIZE + 50):
+            self.validator.check_content_preservation(
+                f"Phrase originale numéro {i} assez longue", ["Phrase courte."]
+            )
+        self.assertEqual(len(self.validator._orig_keys_cache), _ORIG_KEYS_CACHE_SIZE)
+
+
+class TestSheetsRetry(unittest.TestCase):
+    """Test retrying of transient Google Sheets API errors"""
+    
+    def setUp(self):
+        """Set up a manager without authentication, fake buckets and sleep"""
+        self.manager = GoogleSheetsManager.__new__(GoogleSheetsManager)
+        self.read_bucket = mock.Mock()
+        self.write_bucket = mock.Mock()
+        self.delays = []
+        for patcher in (
+            mock.patch.object(google_sheets, '_READ_BUCKET', self.read_bucket),
+            mock.patch.object(google_sheets, '_WRITE_BUCKET', self.write_bucket),
+            mock.patch.object(google_sheets.time, 'sleep', self.delays.append),
+            mock.patch.object(google_sheets.random, 'uniform', return_value=0.0),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+    
+    @staticmethod
+    def _error(status, retry_after=None):
+        headers = {'status': str(status)}
+        if retry_after is not None:
+            headers['retry-after'] = retry_after
+        return HttpError(httplib2.Response(headers), b'{}')
+    
+    def test_retryable_errors_back_off(self):
+        """Test retryable codes are retried with doubling delays"""
+        fn = mock.Mock(side_effect=[self._error(429), self._error(503), 'ok'])
+        
+        self.assertEqual(self.manager._retry(fn), 'ok')
+        self.assertEqual(fn.call_count, 3)
+        self.assertEqual(self.delays, [0.5, 1.0])
+        self.assertEqual(self.write_bucket.acquire.call_count, 3)
+        self.read_bucket.acquire.assert_not_called()
+    
+    def test_non_retryable_errors_raise(self):
+        """Test other codes are raised on the first attempt"""
+        for status in (400, 403, 404):
+            with self.subTest(status=status):
+                fn = mock.Mock(side_effect=self._error(status))
+                with self.assertRaises(HttpError):
+                    self.manager._retry(fn)
+                fn.assert_called_once()
+                self.assertEqual(self.delays, [])
+    
+    def test_gives_up_after_max_attempts(self):
+        """Test the last error is raised once the attempts run out"""
+        fn = mock.Mock(side_effect=self._error(500))
+        
+        with self.assertRaises(HttpError):
+            self.manager._retry(fn, read=True)
+        self.assertEqual(fn.call_count, google_sheets.MAX_RETRY_ATTEMPTS)
+        self.assertEqual(len(self.delays), google_sheets.MAX_RETRY_ATTEMPTS - 1)
+        self.assertEqual(self.read_bucket.acquire.call_count, google_sheets.MAX_RETRY_ATTEMPTS)
+    
+    def test_retry_after_and_max_delay(self):
+        """Test Retry-After is honored and every delay is capped"""
+        fn = mock.Mock(side_effect=[self._error(429, '7'), self._error(429, '600'), 'ok'])
+        self.assertEqual(self.manager._retry(fn), 'ok')
+        self.assertEqual(self.delays, [7.0, google_sheets.RETRY_MAX_DELAY])
+        
+        del self.delays[:]
+        fn = mock.Mock(side_effect=[self._error(502), self._error(502), 'ok'])
+        with mock.patch.object(google_sheets, 'RETRY_BASE_DELAY', 40):
+            self.assertEqual(self.manager._retry(fn), 'ok')
+        self.assertEqual(self.delays, [40, google_sheets.RETRY_MAX_DELAY])
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test client-side pacing of Google Sheets API requests"""
+    
+    def setUp(self):
+        """Set up a fake clock; sleeping records the wait without advancing it"""
+        self.now = 100.0
+        self.waits = []
+    
+    def _bucket(self, capacity, rate):
+        return _TokenBucket(capacity, rate, clock=lambda: self.now, sleep=self.waits.append)
+    
+    def test_burst_within_capacity(self):
+        """Test a full bucket serves capacity requests without waiting"""
+        bucket = self._bucket(capacity=3, rate=1.0)
+        for _ in range(3):
+            bucket.acquire()
+        self.assertEqual(self.waits, [])
+    
+    def test_empty_bucket_queues_callers(self):
+        """Test callers on an empty bucket wait in arrival order"""
+        bucket = self._bucket(capacity=2, rate=2.0)
+        for _ in range(4):
+            bucket.acquire()
+        self.assertEqual(self.waits, [0.5, 1.0])
+    
+    def test_refill_is_capped(self):
+        """Test tokens refill over time but never beyond capacity"""
+        bucket = self._bucket(capacity=2, rate=1.0)
+        bucket.acquire()
+        bucket.acquire()
+        
+        self.now += 1.0
+        bucket.acquire()
+        self.assertEqual(self.waits, [])
+        
+        self.now += 60.0
+        for _ in range(3):
+            bucket.acquire()
+        self.assertEqual(self.waits, [1.0])
+
+
+class TestChunkWrites(unittest.TestCase):
+    """Test splitting of large Google Sheets value writes"""
+    
+    @staticmethod
+    def _rows(count):
+        return [[f"r{i}", i] for i in range(count)]
+    
+    def test_offset_cell(self):
+        """Test A1 references are moved down by whole rows"""
+        self.assertEqual(_offset_cell('A1', 5000), 'A5001')
+        self.assertEqual(_offset_cell('AB12', 3), 'AB15')
+        with self.assertRaises(ValueError):
+            _offset_cell('A', 1)
+    
+    def test_exact_multiple(self):
+        """Test data filling whole chunks leaves no empty trailing group"""
+        rows = self._rows(10)
+        groups = _chunk_writes([('Sheet1', 'A1', rows)], 5)
+        
+        self.assertEqual(groups, [
+            [{'range': 'Sheet1!A1', 'values': rows[:5]}],
+            [{'range': 'Sheet1!A6', 'values': rows[5:]}],
+        ])
+    
+    def test_remainder(self):
+        """Test the rows left over go into a smaller last chunk"""
+        rows = self._rows(12)
+        groups = _chunk_writes([('Sheet1', 'A1', rows)], 5)
+        
+        self.assertEqual([g[0]['range'] for g in groups], ['Sheet1!A1', 'Sheet1!A6', 'Sheet1!A11'])
+        self.assertEqual([len(g[0]['values']) for g in groups], [5, 5, 2])
+        self.assertEqual([row for g in groups for row in g[0]['values']], rows)
+    
+    def test_offset_start(self):
+        """Test chunks of a write starting below A1 keep its column and offset"""
+        rows = self._rows(7)
+        groups = _chunk_writes([('Log', 'B3', rows)], 5)
+        
+        self.assertEqual(groups, [
+            [{'range': 'Log!B3', 'values': rows[:5]}],
+            [{'range': 'Log!B8', 'values': rows[5:]}],
+        ])
+    
+    def test_writes_share_chunks(self):
+        """Test small writes are packed into the same chunk"""
+        first, second = self._rows(3), self._rows(4)
+        groups = _chunk_writes([('A', 'A1', first), ('B', 'A1', second)], 5)
+        
+        self.assertEqual(groups, [
+            [{'range': 'A!A1', 'values': first}, {'range': 'B!A1', 'values': second[:2]}],
+            [{'range': 'B!A3', 'values': second[2:]}],
+        ])
+
+
+class TestTextCleaner(unittest.TestCase):
+    """Test OCR cleanup stays equivalent to the original multi-pass cleaner"""
+    
+    def assertCleaned(self, cases):
+        for raw, expected in cases:
+            with self.subTest(raw=raw):
+                self.assertEqual(clean_text_for_ai(raw), expected)
+    
+    def test_multi_letter_elisions(self):
+        """Test that elided words longer than one letter are rejoined"""
+        self.assertCleaned([
+            ("Il a dit qu ' il viendrait.", "Il a dit qu'il viendrait."),
+            ("Qu ' il parte !", "Qu'il parte !"),
+            ("jusqu ' à demain", "jusqu'à demain"),
+            ("lorsqu ' elle partit", "lorsqu'elle partit"),
+            ("puisqu ' on le sait", "puisqu'on le sait"),
+            ("presqu ' île", "presqu'île"),
+            ("aujourd ' hui", "aujourd'hui"),
+        ])
+    
+    def test_single_letter_elisions(self):
+        """Test that single-letter elisions are rejoined and lowercased"""
+        self.assertCleaned([
+            ("d ' accord", "d'accord"),
+            ("L ' été est chaud.", "l'été est chaud."),
+            ("J ' ai faim", "j'ai faim"),
+            ("n ' est-ce pas", "n'est-ce pas"),
+            ("s ' il te plaît", "s'il te plaît"),
+            ("l ' école d ' art", "l'école d'art"),
+        ])
+    
+    def test_hyphenation(self):
+        """Test de-hyphenation across line breaks and spaces"""
+        self.assertCleaned([
+            ("philo-\n sophe", "philosophe"),
+            ("philo-\nsophe", "philosophe"),
+            ("philo- sophe", "philosophe"),
+            ("porte- \n\n monnaie", "portemonnaie"),
+            ("arc\u2011\nen-ciel", "arcen-ciel"),
+            ("peut-être", "peut-être"),
+            ("Jean -  Paul", "Jean - Paul"),
+        ])
+    
+    def test_stray_apostrophe(self):
+        """Test spaced apostrophes between single letters and typography"""
+        self.assertCleaned([
+            ("x ' y", "x'y"),
+            ("A ' B", "A'B"),
+            ("l '  Europe", "l'Europe"),
+            ("d' accord", "d'accord"),
+            ("d 'accord", "d 'accord"),
+            ("c\u2019est l\u2019été", "c'est l'été"),
+            ("\u00ab Bonjour \u00bb", '" Bonjour "'),
+            ("\u201cSalut\u201d", '"Salut"'),
+        ])
+    
+    def test_whitespace(self):
+        """Test whitespace collapsing and stripping"""
+        self.assertCleaned([
+            ("  Le   chat\n\ndort.\t ", "Le chat dort."),
+            ("ligne\r\nsuivante", "ligne suivante"),
+            ("un\n\n\ndeux", "un deux"),
+            ("a\u00a0b", "a b"),
+            ("\n\t ", ""),
+            ("", ""),
+            ("Texte normal sans défaut.", "Texte normal sans défaut."),
+        ])
+    
+    def test_intentional_differences(self):
+        """Test the cases where the single pass deliberately differs"""
+        self.assertCleaned([
+            # The old sequential passes consumed the shared letter and
+            # left every other hyphen in place ('ab- c')
+            ("a- b- c", "abc"),
+            # A quoted word is not an elision; the old pattern glued it
+            # to its neighbours ("dit'bonjour'à")
+            ("Il a dit ' bonjour ' à tous", "Il a dit ' bonjour ' à tous"),
+        ])
+
+
 if __name__ == '__main__':
     # Run tests with verbose output
     unittest.main(verbosity=2)
@@ -0,0 +1,97 @@
+"""
+Test Web Interface
+Validates the Flask upload route's handling of duplicate uploads
+"""
+
+import io
+import os
+import sys
+import shutil
+import hashlib
+import tempfile
+import unittest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class TestDuplicateUpload(unittest.TestCase):
+    """Test that re-uploading a processed PDF reuses its result"""
+    
+    PDF_BYTES = b"%PDF-1.4\n% test upload\n"
+    
+    @classmethod
+    def setUpClass(cls):
+        """Import the app inside a scratch directory (it creates folders and config.ini)"""
+        cls.cwd = os.getcwd()
+        cls.tmp_dir = tempfile.mkdtemp()
+        os.chdir(cls.tmp_dir)
+        
+        from web_interface import app as app_module
+        cls.app_module = app_module
+        cls.client = app_module.app.test_client()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Leave the scratch directory and remove it"""
+        os.chdir(cls.cwd)
+        shutil.rmtree(cls.tmp_dir)
+    
+    def test_duplicate_upload_not_kept(self):
+        """Test a dedup hit answers from the recorded result and drops the upload"""
+        app_module = self.app_module
+        output_folder = app_module.app.config['OUTPUT_FOLDER']
+        upload_folder = app_module.app.config['UPLOAD_FOLDER']
+        
+        result = {
+            'stats': {},
+            'output_file': os.path.join(output_folder, 'novel.xlsx'),
+            'csv_file': os.path.join(output_folder, 'novel.csv')
+        }
+        for path in (result['output_file'], result['csv_file']):
+            with open(path, 'w') as f:
+                f.write('done')
+        
+        digest = hashlib.sha256(self.PDF_BYTES).hexdigest()
+        key = app_module._result_key(digest, 8, 'ai_rewrite', app_module.config_manager)
+        app_module._record_result(key, result)
+        
+        response = self.client.post('/api/process', data={
+            'file': (io.BytesIO(self.PDF_BYTES), 'novel.pdf'),
+            'word_limit': '8',
+            'processing_mode': 'ai_rewrite'
+        }, content_type='multipart/form-data')
+        payload = response.get_json()
+        
+        self.assertTrue(payload['success'])
+        self.assertEqual(payload['message'], 'Reused previous result')
+        self.assertEqual(os.listdir(upload_folder), [])
+        
+        status = self.client.get(f"/api/status/{payload['job_id']}").get_json()
+        self.assertEqual(status['output_file'], result['output_file'])
+        self.assertEqual(status['progress'], 100)
+        self.assertFalse(status['is_processing'])
+    
+    def test_result_key_tracks_model_and_provider(self):
+        """Test results are not shared across OpenAI models or AI providers"""
+        from src.utils.config_manager import ConfigManager
+        
+        config = ConfigManager(os.path.join(self.tmp_dir, 'key_config.ini'))
+        config.set_openai_model('gpt-5-nano')
+        nano = self.app_module._result_key('digest', 8, 'ai_rewrite', config)
+        
+        config.set_openai_model('gpt-5-mini')
+        mini = self.app_module._result_key('digest', 8, 'ai_rewrite', config)
+        self.assertNotEqual(nano, mini)
+        
+        # The dev flag alone keeps OpenAI; it takes a Gemini key to switch
+        config.set_use_gemini_dev(True)
+        self.assertEqual(self.app_module._result_key('digest', 8, 'ai_rewrite', config), mini)
+        
+        config.set_gemini_api_key('test-key')
+        self.assertNotEqual(self.app_module._result_key('digest', 8, 'ai_rewrite', config), mini)
+
+
+if __name__ == '__main__':
+    # Run tests with verbose output
+    unittest.main(verbosity=2)
@@ -4,13 +4,31 @@ Flask Web Interface for French Novel Processor
 
 import os
 import sys
+import json
+import uuid
+import queue
+import hashlib
+import shutil
+import sqlite3
 import logging
-from flask import Flask, render_template, request, jsonify, send_file
+import functools
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import Manager
+from contextlib import closing
+from typing import Optional
+from flask import Flask, Response, render_template, request, jsonify, send_from_directory, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.utils import secure_filename
 import threading
 import time
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # optional, falls back to Flask's stdlib json provider
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -25,7 +43,36 @@ from src.utils.config_manager import ConfigManager
 from src.core.processor import NovelProcessor
 from src.rewriters.ai_rewriter import AIRewriter
 
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson
+    
+    Status responses are serialized on every poll/event; orjson is several
+    times faster than the stdlib encoder. Types orjson does not handle
+    natively, and datetimes, go through Flask's default() so they encode
+    exactly as with the stock provider (dates as HTTP dates).
+    
+    orjson always emits compact UTF-8: sort_keys maps to OPT_SORT_KEYS and
+    any indent to OPT_INDENT_2, while ensure_ascii and separators are ignored.
+    """
+    
+    def dumps(self, obj, **kwargs) -> str:
+        option = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                  | orjson.OPT_PASSTHROUGH_DATETIME)
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        default = kwargs.get('default', self.default)
+        return orjson.dumps(obj, default=default, option=option).decode()
+    
+    def loads(self, s, **kwargs):
+        """Parse JSON; keyword arguments (object hooks etc.) are not supported by orjson and ignored"""
+        return orjson.loads(s)
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = ORJSONProvider(app)
 app.config['UPLOAD_FOLDER'] = 'uploads'
 app.config['OUTPUT_FOLDER'] = 'output'
 app.config['MAX_CONTENT_LENGTH'] = 100 * 1024 * 1024  # 100MB max file size
@@ -34,17 +81,241 @@ app.config['MAX_CONTENT_LENGTH'] = 100 * 1024 * 1024  # 100MB max file size
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 os.makedirs(app.config['OUTPUT_FOLDER'], exist_ok=True)
 
+# Uploads are copied to disk in chunks of this size while being hashed
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Finished results keyed by upload hash + settings, so re-uploading the
+# same PDF with the same settings reuses the existing output files
+RESULTS_DB = os.path.join(app.config['OUTPUT_FOLDER'], 'processed_uploads.db')
+
+# Seconds between keep-alive comments on an idle /api/events stream
+SSE_KEEPALIVE_SECONDS = 15
+
+# Finished jobs stay queryable for this long before they are evicted
+JOB_TTL_SECONDS = 3600
+
 # Global state
 config_manager = ConfigManager()
-processing_status = {
-    'is_processing': False,
-    'progress': 0,
-    'status_message': '',
-    'current_sentence': '',
-    'stats': {},
-    'error': None,
-    'output_file': None
-}
+
+# Processing jobs run in worker processes so CPU-bound PDF parsing and
+# splitting neither blocks request handling nor serializes on the GIL.
+# Pool and Manager are created on first use and replaced when a worker
+# dies (see _get_job_pool, _reset_job_pool)
+_job_pool: Optional[ProcessPoolExecutor] = None
+_job_manager = None
+_job_pool_lock = threading.Lock()
+
+# {job_id: {'status': Manager dict proxy, 'events': single-slot Manager
+# queue holding the latest status snapshot (None for jobs that never ran),
+# 'changed': Condition notified when a snapshot arrives, 'version': count of
+# snapshots seen, 'finished': time.monotonic() when the job ended or None,
+# 'manager': Manager serving the proxies, kept alive until eviction}};
+# jobs_lock guards the registry itself. Each status update/copy is a single
+# call into the Manager, which serializes them, so readers never see a torn
+# status. Finished jobs are evicted after JOB_TTL_SECONDS
+jobs = {}
+jobs_lock = threading.Lock()
+latest_job_id = None
+
+
+def _new_job(status, events=None, finished: Optional[float] = None, manager=None) -> dict:
+    """Registry entry for a job (see jobs)"""
+    return {
+        'status': status,
+        'events': events,
+        'changed': threading.Condition(),
+        'version': 0,
+        'finished': finished,
+        'manager': manager
+    }
+
+
+def _new_status() -> dict:
+    """Initial status of a processing job"""
+    return {
+        'is_processing': False,
+        'progress': 0,
+        'status_message': '',
+        'current_sentence': '',
+        'stats': {},
+        'error': None,
+        'output_file': None
+    }
+
+
+def _save_upload(file, filepath: str) -> str:
+    """
+    Stream an uploaded file to disk, hashing it on the way
+    
+    Args:
+        file: Werkzeug FileStorage from request.files
+        filepath: Destination path
+        
+    Returns:
+        Hex SHA-256 digest of the file contents
+    """
+    digest = hashlib.sha256()
+    with open(filepath, 'wb') as out:
+        while chunk := file.stream.read(UPLOAD_CHUNK_SIZE):
+            out.write(chunk)
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _result_key(digest: str, word_limit: int, processing_mode: str,
+                config: ConfigManager) -> str:
+    """
+    Key of a processed upload: file hash plus every setting that shapes the output
+    
+    Args:
+        digest: Hex SHA-256 of the uploaded PDF
+        word_limit: Maximum words per sentence
+        processing_mode: Processing mode of the job
+        config: Configuration the job runs (or ran) with
+        
+    Returns:
+        Key for _lookup_result/_record_result
+    """
+    provider = 'gemini' if config.should_use_gemini() else f'openai/{config.get_openai_model()}'
+    return ':'.join([
+        digest,
+        str(word_limit),
+        processing_mode,
+        provider,
+        str(config.get_show_original()),
+        str(config.get_generate_log())
+    ])
+
+
+def _open_results_db() -> sqlite3.Connection:
+    """Open the processed-uploads table (created on first use)"""
+    db = sqlite3.connect(RESULTS_DB, timeout=10, isolation_level=None)
+    db.execute(
+        'CREATE TABLE IF NOT EXISTS processed_uploads ('
+        'key TEXT PRIMARY KEY, result TEXT NOT NULL)'
+    )
+    return db
+
+
+def _lookup_result(key: str) -> Optional[dict]:
+    """
+    Find a finished result for key
+    
+    Results whose output files have since been deleted are dropped.
+    
+    Args:
+        key: Key from _result_key
+        
+    Returns:
+        Status fields of the finished job, or None
+    """
+    try:
+        with closing(_open_results_db()) as db:
+            row = db.execute(
+                'SELECT result FROM processed_uploads WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            
+            result = json.loads(row[0])
+            if all(os.path.exists(result[name]) for name in ('output_file', 'csv_file')):
+                return result
+            
+            db.execute('DELETE FROM processed_uploads WHERE key = ?', (key,))
+    except (sqlite3.Error, ValueError, KeyError) as error:
+        logger.warning(f"Processed-upload lookup failed: {error}")
+    return None
+
+
+def _record_result(key: str, result: dict):
+    """Remember the status fields of a finished job under key"""
+    try:
+        with closing(_open_results_db()) as db:
+            db.execute(
+                'INSERT OR REPLACE INTO processed_uploads (key, result) VALUES (?, ?)',
+                (key, json.dumps(result, default=str))
+            )
+    except sqlite3.Error as error:
+        logger.warning(f"Could not record processed upload: {error}")
+
+
+class _StatusPublisher:
+    """
+    Publishes a job's status from the worker process
+    
+    Every update goes to the shared status dict (read by /api/status);
+    a full snapshot is also queued for /api/events, but per-sentence
+    updates only when the progress percentage changed. The queue holds a
+    single snapshot; a newer one replaces it if nobody has read it yet.
+    """
+    
+    def __init__(self, status, events=None):
+        """
+        Initialize publisher
+        
+        Args:
+            status: Manager dict proxy holding the job's status
+            events: Manager queue receiving status snapshots, if any
+        """
+        self.status = status
+        self.events = events
+        self.state = status.copy()
+    
+    def update(self, update: dict, coalesce: bool = False):
+        """
+        Apply update to the status
+        
+        Args:
+            update: Changed status fields
+            coalesce: Skip the event unless the progress percentage changed
+        """
+        changed = update.get('progress', self.state.get('progress')) != self.state.get('progress')
+        self.state.update(update)
+        self.status.update(update)
+        if self.events is not None and (changed or not coalesce):
+            self._publish(dict(self.state))
+    
+    def _publish(self, snapshot: dict):
+        """Replace the queued snapshot with snapshot"""
+        while True:
+            try:
+                self.events.put_nowait(snapshot)
+                return
+            except queue.Full:
+                try:
+                    self.events.get_nowait()
+                except queue.Empty:
+                    pass
+
+
+def _get_job_pool():
+    """Create the worker pool and its status Manager on first use"""
+    global _job_pool, _job_manager
+    
+    with _job_pool_lock:
+        if _job_pool is None:
+            _job_manager = Manager()
+            _job_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return _job_pool, _job_manager
+
+
+def _reset_job_pool(broken: ProcessPoolExecutor):
+    """
+    Drop a broken worker pool so the next _get_job_pool builds a new one
+    
+    The old Manager is released too; jobs it still serves keep it alive
+    through their registry entry until they are evicted.
+    
+    Args:
+        broken: The pool that raised BrokenProcessPool
+    """
+    global _job_pool, _job_manager
+    
+    with _job_pool_lock:
+        if _job_pool is broken:
+            _job_pool.shutdown(wait=False)
+            _job_pool = None
+            _job_manager = None
 
 
 @app.route('/')
@@ -75,26 +346,28 @@ def update_settings():
     try:
         data = request.json
         
-        if 'api_key' in data:
-            config_manager.set_api_key(data['api_key'])
-        
-        if 'gemini_api_key' in data:
-            config_manager.set_gemini_api_key(data['gemini_api_key'])
-        
-        if 'use_gemini_dev' in data:
-            config_manager.set_use_gemini_dev(data['use_gemini_dev'])
-        
-        if 'word_limit' in data:
-            config_manager.set_word_limit(int(data['word_limit']))
-        
-        if 'processing_mode' in data:
-            config_manager.set_processing_mode(data['processing_mode'])
-        
-        if 'show_original' in data:
-            config_manager.set_show_original(data['show_original'])
-        
-        if 'generate_log' in data:
-            config_manager.set_generate_log(data['generate_log'])
+        # Apply all changes with a single config file write
+        with config_manager.transaction():
+            if 'api_key' in data:
+                config_manager.set_api_key(data['api_key'])
+            
+            if 'gemini_api_key' in data:
+                config_manager.set_gemini_api_key(data['gemini_api_key'])
+            
+            if 'use_gemini_dev' in data:
+                config_manager.set_use_gemini_dev(data['use_gemini_dev'])
+            
+            if 'word_limit' in data:
+                config_manager.set_word_limit(int(data['word_limit']))
+            
+            if 'processing_mode' in data:
+                config_manager.set_processing_mode(data['processing_mode'])
+            
+            if 'show_original' in data:
+                config_manager.set_show_original(data['show_original'])
+            
+            if 'generate_log' in data:
+                config_manager.set_generate_log(data['generate_log'])
         
         return jsonify({'success': True, 'message': 'Settings saved successfully'})
     
@@ -102,6 +375,28 @@ def update_settings():
         return jsonify({'success': False, 'error': str(e)}), 400
 
 
+@functools.lru_cache(maxsize=32)
+def _get_rewriter(rewriter_class, api_key: str):
+    """
+    Rewriter used to check an API key, reused per (class, key)
+    
+    Repeated checks of the same key then share the SDK client and its
+    open HTTPS connections instead of setting them up on every request.
+    lru_cache is safe to call from concurrent request threads.
+    """
+    return rewriter_class(api_key)
+
+
+@app.route('/api/clear-rewriter-cache', methods=['POST'])
+def clear_rewriter_cache():
+    """Drop the cached API-key test clients (debug mode only)"""
+    if not app.debug:
+        return jsonify({'error': 'Not found'}), 404
+    
+    _get_rewriter.cache_clear()
+    return jsonify({'success': True})
+
+
 @app.route('/api/test-api-key', methods=['POST'])
 def test_api_key():
     """Test OpenAI API key"""
@@ -113,7 +408,7 @@ def test_api_key():
             return jsonify({'success': False, 'error': 'API key required'}), 400
         
         # Test the key
-        rewriter = AIRewriter(api_key)
+        rewriter = _get_rewriter(AIRewriter, api_key)
         is_valid, message = rewriter.validate_api_key()
         
         return jsonify({'success': is_valid, 'message': message})
@@ -135,7 +430,7 @@ def test_gemini_key():
         # Test the key
         try:
             from src.rewriters.gemini_rewriter import GeminiRewriter
-            rewriter = GeminiRewriter(api_key)
+            rewriter = _get_rewriter(GeminiRewriter, api_key)
             is_valid, message = rewriter.validate_api_key()
             return jsonify({'success': is_valid, 'message': message})
         except ImportError:
@@ -145,47 +440,144 @@ def test_gemini_key():
         return jsonify({'success': False, 'message': str(e)})
 
 
+def _job_snapshot(job_id: Optional[str]) -> Optional[dict]:
+    """Copy of a job's status, or None for an unknown job"""
+    with jobs_lock:
+        job = jobs.get(job_id)
+    
+    if job is None:
+        return None
+    
+    return job['status'].copy()
+
+
 @app.route('/api/status', methods=['GET'])
 def get_status():
-    """Get processing status"""
-    return jsonify(processing_status)
+    """Get processing status of ?job_id= (defaults to the latest job)"""
+    snapshot = _job_snapshot(request.args.get('job_id') or latest_job_id)
+    return jsonify(snapshot if snapshot is not None else _new_status())
+
+
+@app.route('/api/status/<job_id>', methods=['GET'])
+def get_job_status(job_id):
+    """Get processing status of one job"""
+    snapshot = _job_snapshot(job_id)
+    
+    if snapshot is None:
+        return jsonify({'error': 'Unknown job'}), 404
+    
+    return jsonify(snapshot)
+
+
+def _sse_message(data: dict) -> str:
+    """Format data as a Server-Sent Events message"""
+    return f"data: {app.json.dumps(data)}\n\n"
+
+
+@app.route('/api/events/<job_id>', methods=['GET'])
+def job_events(job_id):
+    """Stream a job's status as Server-Sent Events each time it changes"""
+    with jobs_lock:
+        job = jobs.get(job_id)
+    
+    if job is None:
+        return jsonify({'error': 'Unknown job'}), 404
+    
+    status, changed = job['status'], job['changed']
+    
+    def generate():
+        # Every subscriber reads the shared status; the pump thread only
+        # tells them when it changed, so streams don't compete for events
+        with changed:
+            seen = job['version']
+        snapshot = status.copy()
+        yield _sse_message(snapshot)
+        
+        while snapshot.get('is_processing'):
+            with changed:
+                changed.wait_for(lambda: job['version'] != seen, timeout=SSE_KEEPALIVE_SECONDS)
+                version = job['version']
+            
+            if version == seen:
+                # Nothing new; re-check in case the job ended unannounced
+                snapshot = status.copy()
+                if snapshot.get('is_processing'):
+                    yield ': keep-alive\n\n'
+                    continue
+            else:
+                seen = version
+                snapshot = status.copy()
+            yield _sse_message(snapshot)
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
 
 
-def process_pdf_async(pdf_path: str, word_limit: int, processing_mode: str):
-    """Process PDF in background thread"""
-    global processing_status
+def run_processing_job(job_id: str, status, pdf_path: str, word_limit: int,
+                       processing_mode: str, config_path: str, output_folder: str,
+                       upload_digest: Optional[str] = None, events=None):
+    """
+    Process a PDF in a worker process
+    
+    Progress is published through status, a Manager dict shared with the
+    web process, and as snapshots on events (see _StatusPublisher).
+    Related fields are written with a single update() so a reader never
+    sees half of a change.
+    
+    Args:
+        job_id: ID of the job
+        status: Manager dict proxy holding the job's status
+        pdf_path: Path of the uploaded PDF
+        word_limit: Maximum words per sentence
+        processing_mode: Processing mode to use
+        config_path: Path of the config file (re-read so settings saved
+            after the worker started are picked up)
+        output_folder: Folder for the generated files
+        upload_digest: If given, the finished result is recorded under the
+            upload's hash and the settings this job ran with (see
+            _result_key) for reuse by identical uploads
+        events: Manager queue receiving status snapshots for /api/events
+    """
+    publisher = _StatusPublisher(status, events)
+    processor = None
     
     try:
-        processing_status['is_processing'] = True
-        processing_status['progress'] = 0
-        processing_status['status_message'] = 'Starting processing...'
-        processing_status['error'] = None
-        processing_status['output_file'] = None
+        publisher.update({
+            'is_processing': True,
+            'progress': 0,
+            'status_message': 'Starting processing...',
+            'error': None,
+            'output_file': None
+        })
         
         # Create processor
-        processor = NovelProcessor(config_manager)
+        processor = NovelProcessor(ConfigManager(config_path))
         
         # Progress callback
         def progress_callback(current, total, message_or_sentence):
-            processing_status['progress'] = int((current / total) * 100) if total > 0 else 0
+            update = {'progress': int((current / total) * 100) if total > 0 else 0}
             
             # Handle both message strings and sentence objects
             if isinstance(message_or_sentence, str):
                 # Check if it looks like a sentence (not a status message)
                 if len(message_or_sentence) > 20 and not message_or_sentence.endswith('...'):
-                    processing_status['current_sentence'] = message_or_sentence
-                    processing_status['status_message'] = f'Processing sentence {current}/{total}'
+                    update['current_sentence'] = message_or_sentence
+                    update['status_message'] = f'Processing sentence {current}/{total}'
                 else:
-                    processing_status['status_message'] = message_or_sentence
-                    processing_status['current_sentence'] = ''
+                    update['status_message'] = message_or_sentence
+                    update['current_sentence'] = ''
             else:
-                processing_status['status_message'] = f'Processing sentence {current}/{total}'
-                processing_status['current_sentence'] = ''
+                update['status_message'] = f'Processing sentence {current}/{total}'
+                update['current_sentence'] = ''
             
             # Update stats if available
             if hasattr(processor, 'results'):
-                summary = processor.get_summary()
-                processing_status['stats'] = summary
+                update['stats'] = processor.get_summary()
+            
+            publisher.update(update, coalesce=True)
         
         # Process PDF
         results = processor.process_pdf(
@@ -196,69 +588,215 @@ def process_pdf_async(pdf_path: str, word_limit: int, processing_mode: str):
         )
         
         # Generate output files
-        processing_status['status_message'] = 'Generating output files...'
-        processing_status['progress'] = 95
+        publisher.update({'status_message': 'Generating output files...', 'progress': 95})
         
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         base_name = os.path.splitext(os.path.basename(pdf_path))[0]
+        csv_path = os.path.join(output_folder, f'{base_name}_{timestamp}.csv')
+        excel_path = os.path.join(output_folder, f'{base_name}_{timestamp}.xlsx')
+        credentials_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'credentials.json')
+        token_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'token.json')
         
-        # Save to CSV
-        csv_path = os.path.join(app.config['OUTPUT_FOLDER'], f'{base_name}_{timestamp}.csv')
-        processor.save_to_csv(csv_path)
-        
-        # Save to Excel
-        excel_path = os.path.join(app.config['OUTPUT_FOLDER'], f'{base_name}_{timestamp}.xlsx')
-        processor.save_to_excel(excel_path)
-        
-        # Save to Google Sheets
-        processing_status['status_message'] = 'Creating Google Spreadsheet...'
-        processing_status['progress'] = 97
-        
-        try:
-            credentials_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'credentials.json')
-            token_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'token.json')
-            
-            sheets_result = processor.save_to_google_sheets(
+        # CSV, Excel and Google Sheets output only read the results, so they
+        # run side by side: the disk writes overlap the Sheets API round-trips
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix='job-output') as executor:
+            sheets_future = executor.submit(
+                processor.save_to_google_sheets,
                 title=f'{base_name}_{timestamp}',
                 credentials_path=credentials_path,
                 token_path=token_path
             )
+            csv_future = executor.submit(processor.save_to_csv, csv_path)
+            excel_future = executor.submit(processor.save_to_excel, excel_path)
+            
+            # Local files are required; their errors fail the job
+            csv_future.result()
+            excel_future.result()
+            publisher.update({'status_message': 'Creating Google Spreadsheet...', 'progress': 97})
             
-            processing_status['google_sheets_url'] = sheets_result['spreadsheet_url']
-            processing_status['google_sheets_id'] = sheets_result['spreadsheet_id']
-            processing_status['status_message'] = 'Google Spreadsheet created successfully!'
-        except Exception as e:
-            logger.error(f"Google Sheets error: {str(e)}")
-            processing_status['google_sheets_error'] = str(e)
-            processing_status['status_message'] = 'Local files created (Google Sheets failed)'
+            try:
+                sheets_result = sheets_future.result()
+                
+                publisher.update({
+                    'google_sheets_url': sheets_result['spreadsheet_url'],
+                    'google_sheets_id': sheets_result['spreadsheet_id'],
+                    'status_message': 'Google Spreadsheet created successfully!'
+                })
+            except Exception as e:
+                logger.error(f"Google Sheets error: {str(e)}")
+                publisher.update({
+                    'google_sheets_error': str(e),
+                    'status_message': 'Local files created (Google Sheets failed)'
+                })
         
         # Get final summary
-        summary = processor.get_summary()
-        processing_status['stats'] = summary
-        processing_status['output_file'] = excel_path
-        processing_status['csv_file'] = csv_path
+        result = {
+            'stats': processor.get_summary(),
+            'output_file': excel_path,
+            'csv_file': csv_path
+        }
+        if 'google_sheets_url' in publisher.state:
+            result['google_sheets_url'] = publisher.state['google_sheets_url']
+            result['google_sheets_id'] = publisher.state['google_sheets_id']
+        
+        if upload_digest is not None:
+            _record_result(
+                _result_key(upload_digest, word_limit, processing_mode, processor.config),
+                result
+            )
         
-        processing_status['progress'] = 100
-        processing_status['status_message'] = 'Processing complete!'
-        processing_status['is_processing'] = False
+        publisher.update({
+            **result,
+            'progress': 100,
+            'status_message': 'Processing complete!',
+            'is_processing': False
+        })
     
     except Exception as e:
-        processing_status['error'] = str(e)
-        processing_status['is_processing'] = False
-        processing_status['status_message'] = f'Error: {str(e)}'
-        logger.error(f"Processing error: {str(e)}")
+        publisher.update({
+            'error': str(e),
+            'is_processing': False,
+            'status_message': f'Error: {str(e)}'
+        })
+        logger.error(f"Processing error (job {job_id}): {str(e)}")
         import traceback
         traceback.print_exc()
+    
+    finally:
+        if processor is not None:
+            processor.close()
+
+
+def _pump_events(job: dict):
+    """
+    Wake a job's /api/events subscribers whenever its worker publishes
+    
+    Runs in a thread of the web process until the job stops processing;
+    the queued snapshots only serve as wake-up signals.
+    
+    Args:
+        job: Registry entry of the job (see jobs)
+    """
+    events, changed = job['events'], job['changed']
+    
+    try:
+        while True:
+            try:
+                snapshot = events.get(timeout=SSE_KEEPALIVE_SECONDS)
+            except queue.Empty:
+                if job['finished'] is not None:
+                    break
+                continue
+            
+            with changed:
+                job['version'] += 1
+                changed.notify_all()
+            
+            if not snapshot.get('is_processing'):
+                break
+    except (EOFError, OSError) as e:
+        logger.warning(f"Event pump stopped: {e}")
+    finally:
+        with changed:
+            job['version'] += 1
+            changed.notify_all()
+
+
+def _evict_finished_jobs():
+    """Drop jobs that finished more than JOB_TTL_SECONDS ago; call with jobs_lock held"""
+    cutoff = time.monotonic() - JOB_TTL_SECONDS
+    expired = [
+        job_id for job_id, job in jobs.items()
+        if job['finished'] is not None and job['finished'] < cutoff
+    ]
+    for job_id in expired:
+        del jobs[job_id]
+
+
+def _on_job_done(job_id, status, events, future):
+    """Mark the job finished and record failures that happened outside run_processing_job (e.g. a crashed worker)"""
+    with jobs_lock:
+        job = jobs.get(job_id)
+        if job is not None:
+            job['finished'] = time.monotonic()
+    
+    error = future.exception()
+    if error is not None:
+        logger.error(f"Processing worker failed: {error}")
+        _StatusPublisher(status, events).update({
+            'error': str(error),
+            'is_processing': False,
+            'status_message': f'Error: {str(error)}'
+        })
+
+
+def _register_job(job_id: str, job: dict):
+    """Add a job to the registry as the latest one"""
+    global latest_job_id
+    
+    with jobs_lock:
+        _evict_finished_jobs()
+        jobs[job_id] = job
+        latest_job_id = job_id
+
+
+def _start_job(job_id: str, filepath: str, word_limit: int, processing_mode: str,
+               upload_digest: Optional[str]) -> dict:
+    """
+    Submit a processing job to the worker pool and register it
+    
+    The job is only registered (and its event pump started) once the pool
+    accepted it. A pool broken by a dead worker is replaced and the submit
+    retried once; if that fails too, the job is registered as failed.
+    
+    Args:
+        job_id: ID of the new job
+        filepath: Path of the uploaded PDF
+        word_limit: Maximum words per sentence
+        processing_mode: 'ai_rewrite' or 'mechanical_chunking'
+        upload_digest: Hex SHA-256 of the upload (see run_processing_job)
+        
+    Returns:
+        The job's registry entry (without events if it could not start)
+    """
+    error = None
+    for _ in range(2):
+        pool, manager = _get_job_pool()
+        status = manager.dict(_new_status())
+        status.update({'is_processing': True, 'status_message': 'Queued...'})
+        events = manager.Queue(maxsize=1)
+        
+        try:
+            future = pool.submit(
+                run_processing_job, job_id, status, filepath, word_limit, processing_mode,
+                config_manager.config_path, app.config['OUTPUT_FOLDER'], upload_digest, events
+            )
+        except BrokenProcessPool as e:
+            logger.warning(f"Processing pool broken, recreating it: {e}")
+            _reset_job_pool(pool)
+            error = e
+            continue
+        
+        job = _new_job(status, events, manager=manager)
+        _register_job(job_id, job)
+        threading.Thread(target=_pump_events, args=(job,), daemon=True).start()
+        future.add_done_callback(functools.partial(_on_job_done, job_id, status, events))
+        return job
+    
+    logger.error(f"Could not start processing job {job_id}: {error}")
+    status = _new_status()
+    status.update({
+        'error': str(error),
+        'status_message': f'Error: {str(error)}'
+    })
+    job = _new_job(status, finished=time.monotonic())
+    _register_job(job_id, job)
+    return job
 
 
 @app.route('/api/process', methods=['POST'])
 def process_pdf():
     """Start PDF processing"""
-    global processing_status
-    
-    if processing_status['is_processing']:
-        return jsonify({'success': False, 'error': 'Processing already in progress'}), 400
-    
     try:
         # Check if file was uploaded
         if 'file' not in request.files:
@@ -276,20 +814,32 @@ def process_pdf():
         word_limit = int(request.form.get('word_limit', config_manager.get_word_limit()))
         processing_mode = request.form.get('processing_mode', config_manager.get_processing_mode())
         
-        # Save uploaded file
+        # Save uploaded file (one folder per job so concurrent uploads
+        # of the same filename don't overwrite each other)
+        job_id = uuid.uuid4().hex
+        upload_dir = os.path.join(app.config['UPLOAD_FOLDER'], job_id)
+        os.makedirs(upload_dir, exist_ok=True)
         filename = secure_filename(file.filename)
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(filepath)
+        filepath = os.path.join(upload_dir, filename)
+        digest = _save_upload(file, filepath)
         
-        # Start processing in background
-        thread = threading.Thread(
-            target=process_pdf_async,
-            args=(filepath, word_limit, processing_mode)
-        )
-        thread.daemon = True
-        thread.start()
+        # An identical upload processed with the same settings is served
+        # from its existing output files; the duplicate copy is not kept
+        result = _lookup_result(_result_key(digest, word_limit, processing_mode, config_manager))
+        if result is not None:
+            shutil.rmtree(upload_dir, ignore_errors=True)
+            status = _new_status()
+            status.update(result)
+            status.update({'progress': 100, 'status_message': 'Processing complete! (reused previous result)'})
+            _register_job(job_id, _new_job(status, finished=time.monotonic()))
+            return jsonify({'success': True, 'message': 'Reused previous result', 'job_id': job_id})
         
-        return jsonify({'success': True, 'message': 'Processing started'})
+        # Start processing in a worker process
+        job = _start_job(job_id, filepath, word_limit, processing_mode, digest)
+        if job['events'] is None:
+            return jsonify({'success': False, 'error': job['status']['error'], 'job_id': job_id}), 500
+        
+        return jsonify({'success': True, 'message': 'Processing started', 'job_id': job_id})
     
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 400
@@ -299,8 +849,14 @@ def process_pdf():
 def download_file(filename):
     """Download output file"""
     try:
-        filepath = os.path.join(app.config['OUTPUT_FOLDER'], filename)
-        return send_file(filepath, as_attachment=True)
+        # send_from_directory rejects paths escaping OUTPUT_FOLDER and answers
+        # conditional requests (ETag/Last-Modified) with 304 Not Modified
+        return send_from_directory(
+            os.path.abspath(app.config['OUTPUT_FOLDER']),
+            filename,
+            as_attachment=True,
+            max_age=0
+        )
     except Exception as e:
         return jsonify({'error': str(e)}), 404
 
@@ -314,4 +870,6 @@ if __name__ == '__main__':
     logger.info("Press Ctrl+C to stop the server")
     logger.info("=" * 60)
     
-    app.run(debug=False, host='0.0.0.0', port=5000)
+    # Development server; production deployments should use wsgi.py.
+    # FLASK_DEBUG=1 enables the debugger
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1', host='0.0.0.0', port=5000)
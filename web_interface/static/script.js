@@ -2,6 +2,7 @@
 
 let selectedFile = null;
 let processingInterval = null;
+let currentJobId = null;
 let startTime = null;
 let outputFiles = {};
 const stageOrder = ['upload', 'analyzing', 'rewriting', 'export'];
@@ -347,8 +348,9 @@ async function startProcessing() {
         const result = await response.json();
         
         if (result.success) {
-            // Start polling for status
-            startStatusPolling();
+            // Follow status updates
+            currentJobId = result.job_id;
+            startStatusStream();
         } else {
             showError(result.error);
         }
@@ -357,23 +359,53 @@ async function startProcessing() {
     }
 }
 
+// Apply a status update; returns true once the job has finished
+function handleStatus(status) {
+    updateProgress(status);
+    
+    if (status.is_processing) {
+        return false;
+    }
+    
+    if (status.error) {
+        showError(status.error);
+    } else if (status.output_file) {
+        showResults(status);
+    }
+    return true;
+}
+
+// Follow status updates pushed by the server (Server-Sent Events),
+// falling back to polling if the stream is unavailable
+function startStatusStream() {
+    if (!window.EventSource) {
+        startStatusPolling();
+        return;
+    }
+    
+    const source = new EventSource(`/api/events/${encodeURIComponent(currentJobId)}`);
+    
+    source.onmessage = (event) => {
+        if (handleStatus(JSON.parse(event.data))) {
+            source.close();
+        }
+    };
+    
+    source.onerror = () => {
+        source.close();
+        startStatusPolling();
+    };
+}
+
 // Start polling for status updates
 function startStatusPolling() {
     processingInterval = setInterval(async () => {
         try {
-            const response = await fetch('/api/status');
+            const response = await fetch(`/api/status/${encodeURIComponent(currentJobId)}`);
             const status = await response.json();
             
-            updateProgress(status);
-            
-            if (!status.is_processing) {
+            if (handleStatus(status)) {
                 clearInterval(processingInterval);
-                
-                if (status.error) {
-                    showError(status.error);
-                } else if (status.output_file) {
-                    showResults(status);
-                }
             }
         } catch (error) {
             console.error('Status polling error:', error);
@@ -0,0 +1,22 @@
+"""
+WSGI entry point for the French Novel Processor web interface
+
+Run with a production server instead of Flask's development server, e.g.:
+
+    gunicorn --chdir web_interface -w 1 --threads 8 wsgi:application
+
+Keep a single worker process: processing jobs and their status live in
+that process (see app.jobs), so a second worker could not answer status
+requests for jobs the first one started. Threads give the concurrency;
+the CPU-heavy processing already runs in the job process pool.
+"""
+
+import os
+import sys
+
+# Allow "gunicorn web_interface.wsgi:application" from the project root too
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app import app
+
+application = app